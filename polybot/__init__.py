@@ -1,4 +1,18 @@
-from .app import App, AppBuilder, AppInterface, AppDependencies, create_test_app_builder
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app import App, AppBuilder, AppInterface, AppDependencies, create_test_app_builder
+
+# Resolved on first attribute access (PEP 562), so importing a single
+# subpackage such as polybot.common does not pull in the whole app graph
+_LAZY = {
+    "App",
+    "AppBuilder",
+    "AppInterface",
+    "AppDependencies",
+    "create_test_app_builder",
+}
 
 __all__ = [
     "App",
@@ -8,3 +22,15 @@ __all__ = [
     "create_test_app_builder",
 ]
 
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(".app", __name__), name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY)
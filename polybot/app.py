@@ -15,10 +15,11 @@ Usage:
         .build()
 """
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, Optional, Protocol, Type
+from typing import Callable, Optional, Type
 
-from polybot.channel import ChannelInterface, Channel
+from polybot.channel import ChannelInterface, Channel, OrderRing
 from polybot.common.context_provider import ContextBuilder
 from polybot.common.types import OrderRequest
 from polybot.eml import ExecLink
@@ -32,23 +33,26 @@ from polybot.strategy import create_strategy, StrategyRegistry
 OrderHandler = Callable[[OrderRequest], None]
 
 
-class AppInterface(Protocol):
-    """Protocol defining the public interface of the App."""
+class AppInterface(ABC):
+    """Abstract base defining the public interface of the App."""
     
+    @abstractmethod
     def initialize(self) -> None:
         """Initialize the application by loading all registered strategies."""
         ...
 
+    @abstractmethod
     def run(self) -> None:
         """Start the trading engine."""
         ...
 
+    @abstractmethod
     def stop(self) -> None:
         """Stop the trading engine gracefully."""
         ...
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppDependencies:
     """
     Container for all App dependencies.
@@ -64,6 +68,7 @@ class AppDependencies:
     order_reader: IOrderReader
     position_reader: IPositionReader
     registry: StrategyRegistry
+    order_ring: Optional[OrderRing] = None
 
 
 class App(AppInterface):
@@ -99,6 +104,7 @@ class App(AppInterface):
             iml=deps.iml,
             eml=deps.eml,
             context_builder=self._context_builder,
+            order_ring=deps.order_ring,
         )
     
     @property
@@ -131,8 +137,9 @@ class App(AppInterface):
         """
         for entry in self._deps.registry.get_all():
             # Register limits for each instrument
-            for limit in entry.limits:
-                self._deps.limit_store.set_limit(limit.instrument_id, limit)
+            self._deps.limit_store.set_limits(
+                (limit.instrument_id, limit) for limit in entry.limits
+            )
             
             # Create the strategy instance
             config = entry.to_strategy_config(enabled=True)
@@ -147,7 +154,12 @@ class App(AppInterface):
 
     def stop(self) -> None:
         """Stop the trading engine gracefully."""
-        self._channel.stop()
+        # The channel stops sending orders first, so the EML sees its last order before it stops.
+        # The EML is stopped even if the channel reports a failed order send.
+        try:
+            self._channel.stop()
+        finally:
+            self._deps.eml.stop()
 
 
 class AppBuilder:
@@ -176,6 +188,17 @@ class AppBuilder:
             .build()
     """
     
+    __slots__ = (
+        "_ids",
+        "_iml",
+        "_eml",
+        "_limit_store",
+        "_order_manager",
+        "_position_manager",
+        "_registry",
+        "_order_ring",
+    )
+    
     def __init__(self):
         """Initialize builder with no components set."""
         self._ids: Optional[IInstrumentDefintionStore] = None
@@ -185,6 +208,7 @@ class AppBuilder:
         self._order_manager: Optional[IOrderManager] = None
         self._position_manager: Optional[PositionManager] = None
         self._registry: Optional[StrategyRegistry] = None
+        self._order_ring: Optional[OrderRing] = None
     
     def with_ids(self, ids: IInstrumentDefintionStore) -> "AppBuilder":
         """Set the instrument definition store."""
@@ -221,6 +245,11 @@ class AppBuilder:
         self._registry = registry
         return self
     
+    def with_order_ring(self, order_ring: OrderRing) -> "AppBuilder":
+        """Submit orders through a ring drained by a dedicated sender thread."""
+        self._order_ring = order_ring
+        return self
+    
     def build(self) -> App:
         """
         Build the App instance with configured or default dependencies.
@@ -254,6 +283,7 @@ class AppBuilder:
             order_reader=order_manager,  # OrderManager implements both interfaces
             position_reader=position_manager,
             registry=registry,
+            order_ring=self._order_ring,
         )
         
         return App(deps)
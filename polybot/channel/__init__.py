@@ -1,11 +1,14 @@
 from .channel_interface import ChannelInterface
 from .channel import Channel, OrderHandler
 from .builder import build_channel, ChannelBuilder
+from .order_ring import OrderRing, OrderSender
 
 __all__ = [
 	"Channel",
 	"ChannelInterface",
 	"ChannelBuilder",
 	"OrderHandler",
+	"OrderRing",
+	"OrderSender",
 	"build_channel",
 ]
\ No newline at end of file
@@ -9,6 +9,7 @@ from typing import Optional
 
 from .channel import Channel
 from .channel_interface import ChannelInterface
+from .order_ring import OrderRing
 
 from polybot.common.context_provider import ContextBuilder
 from polybot.eml import ExecLink
@@ -34,6 +35,7 @@ class ChannelBuilder:
         self._iml: Optional[MarketDataProvider] = None
         self._eml: Optional[ExecLink] = None
         self._context_builder: Optional[ContextBuilder] = None
+        self._order_ring: Optional[OrderRing] = None
     
     def with_ids(self, ids: IInstrumentDefintionStore) -> "ChannelBuilder":
         """Set the instrument definition store."""
@@ -55,6 +57,11 @@ class ChannelBuilder:
         self._context_builder = context_builder
         return self
     
+    def with_order_ring(self, order_ring: OrderRing) -> "ChannelBuilder":
+        """Submit orders through a ring drained by a dedicated sender thread."""
+        self._order_ring = order_ring
+        return self
+    
     def build(self) -> ChannelInterface:
         """
         Build the Channel instance.
@@ -79,6 +86,7 @@ class ChannelBuilder:
             iml=self._iml,
             eml=self._eml,
             context_builder=self._context_builder,
+            order_ring=self._order_ring,
         )
 
 
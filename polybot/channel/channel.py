@@ -1,10 +1,10 @@
-from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
+from operator import attrgetter
+from typing import Callable, Iterator, Optional
 
 from polybot.common.context_provider import ContextBuilder, ContextProvider
 from polybot.ids.interface import IInstrumentDefintionStore
-from polybot.common.types import INSTRUMENT_ID, OrderRequest
+from polybot.common.types import INSTRUMENT_ID, OrderRequest, intern_instrument_id
 from polybot.common.exceptions import ChannelStateError
 from polybot.strategy import StrategyInterface, TradeData
 from polybot.iml.interface import MarketDataConsumer, MarketDataProvider
@@ -12,29 +12,63 @@ from polybot.iml.messages import (
 	OrderBookUpdateEvent,
 	TradeEvent,
 	OrderBookSnapshotEvent,
+	Level,
 )
 from polybot.eml import ExecLink
 
 from .channel_interface import ChannelInterface
 from .strategy_router import StrategyRouter
 from .order_book_manager import OrderBookManager
+from .order_ring import OrderRing, OrderSender
 
 # Type alias for order handler callback
 OrderHandler = Callable[[OrderRequest], None]
 
+def _discard_order_id(send_order: Callable[[OrderRequest], object]) -> OrderHandler:
+	"""Adapt an ExecLink.send_order, which returns the order id, to an OrderHandler."""
+	def handler(order: OrderRequest) -> None:
+		send_order(order)
+	return handler
+
+_get_price = attrgetter("price")
+_get_size = attrgetter("size")
+
+
+def _level_pairs(levels: list[Level]) -> Iterator[tuple[float, float]]:
+	"""
+	Stream (price, size) pairs from snapshot levels.
+
+	zip reuses its result tuple once the consumer unpacks it, so this avoids
+	allocating a tuple per level as well as the intermediate list.
+	"""
+	return zip(map(_get_price, levels), map(_get_size, levels))
+
+
+# Lifecycle states as plain ints, so the state guards compare ints rather than enum members
+STATUS_INITIALIZED = 0
+STATUS_RUNNING = 1
+STATUS_ERROR = 2
+STATUS_STOPPED = 3
+
+
 class ChannelStatus(Enum):
 	"""Enum representing the lifecycle states of a Channel."""
-	INITIALIZED = 0
-	RUNNING = 1
-	ERROR = 2
-	STOPPED = 3
+	INITIALIZED = STATUS_INITIALIZED
+	RUNNING = STATUS_RUNNING
+	ERROR = STATUS_ERROR
+	STOPPED = STATUS_STOPPED
 
 
-@dataclass
 class InstrumentWrapper:
 	"""Wrapper for instrument tracking within the channel."""
-	instrument_id: INSTRUMENT_ID
-	is_tradable: bool
+	__slots__ = ("instrument_id", "is_tradable")
+
+	def __init__(self, instrument_id: INSTRUMENT_ID, is_tradable: bool):
+		self.instrument_id = instrument_id
+		self.is_tradable = is_tradable
+
+	def __repr__(self) -> str:
+		return f"InstrumentWrapper(instrument_id={self.instrument_id!r}, is_tradable={self.is_tradable})"
 
 
 class Channel(ChannelInterface, MarketDataConsumer):
@@ -44,6 +78,23 @@ class Channel(ChannelInterface, MarketDataConsumer):
 	The Channel manages the lifecycle of strategies, maintains order books for subscribed
 	instruments, and routes market data events to registered strategies.
 	"""
+	__slots__ = (
+		"ids",
+		"iml",
+		"eml",
+		"context_builder",
+		"order_ring",
+		"instruments",
+		"orderbook_manager",
+		"strategy_router",
+		"_ctx",
+		"_books",
+		"_trade_dispatch",
+		"_book_change_dispatch",
+		"_order_sender",
+		"_order_handler",
+		"_status",
+	)
 	
 	def __init__(
 		self,
@@ -51,6 +102,7 @@ class Channel(ChannelInterface, MarketDataConsumer):
 		iml: MarketDataProvider,
 		eml: ExecLink,
 		context_builder: ContextBuilder,
+		order_ring: Optional[OrderRing] = None,
 	):
 		"""
 		Initialize the Channel with required dependencies.
@@ -60,29 +112,58 @@ class Channel(ChannelInterface, MarketDataConsumer):
 			iml: Market data provider for subscribing to market data
 			eml: Execution link for sending orders
 			context_builder: Builder for creating strategy execution contexts
+			order_ring: Optional ring that hands orders to a dedicated sender
+				thread. When omitted, orders are sent synchronously.
 		"""
 		# From parameters
 		self.ids = ids
 		self.iml = iml
 		self.eml = eml
 		self.context_builder = context_builder
+		self.order_ring = order_ring
+
+		# Shared by every event; strategy views derive their own from it
+		self._ctx: ContextProvider = context_builder.build_static_context()
 
 		# Construct new data structures
 		self.instruments: dict[INSTRUMENT_ID, InstrumentWrapper] = {}
 		self.orderbook_manager = OrderBookManager()
 		self.strategy_router = StrategyRouter()
 
+		# The manager's live dict, indexed directly on the hot path
+		self._books = self.orderbook_manager.books
+
+		# Instrument -> handlers with its orderbook, routes and context pre-bound
+		self._trade_dispatch: dict[INSTRUMENT_ID, Callable[[TradeEvent], None]] = {}
+		self._book_change_dispatch: dict[INSTRUMENT_ID, Callable[[], None]] = {}
+		self._order_sender = OrderSender(order_ring, eml) if order_ring is not None else None
+
+		# Chosen once so the hot path never branches on how orders are submitted
+		self._order_handler: OrderHandler = order_ring.publish if order_ring is not None else _discard_order_id(eml.send_order)
+
 		# State
-		self.status = ChannelStatus.INITIALIZED
+		self._status = STATUS_INITIALIZED
 
+	@property
+	def status(self) -> ChannelStatus:
+		"""The current lifecycle state of the channel."""
+		return ChannelStatus(self._status)
 
 	def run(self) -> None:
 		"""Start the channel, enabling market data processing."""
-		self.status = ChannelStatus.RUNNING
+		self.strategy_router.freeze()
+		# Rebind the handlers to the frozen route tuples
+		for iid in self.instruments:
+			self._specialize(iid)
+		if self._order_sender is not None:
+			self._order_sender.start()
+		self._status = STATUS_RUNNING
 
 	def stop(self) -> None:
 		"""Stop the channel, disabling market data processing."""
-		self.status = ChannelStatus.STOPPED
+		self._status = STATUS_STOPPED
+		if self._order_sender is not None:
+			self._order_sender.stop()
 
 	def add_strategy(self, strategy: StrategyInterface) -> None:
 		"""
@@ -100,78 +181,54 @@ class Channel(ChannelInterface, MarketDataConsumer):
 		Raises:
 			ChannelStateError: If the channel is not in INITIALIZED state
 		"""
-		if self.status != ChannelStatus.INITIALIZED:
+		if self._status != STATUS_INITIALIZED:
 			msg = f"Strategy can only be added during initialisation phase. Current status={self.status}"
 			self._throw_channel_error(msg)
 
 		metadata = strategy.get_metadata()
-		instruments = metadata.instruments
 
-		# Ensure all instruments are added
-		for iid in instruments:
+		# Ensure all instruments are added, keyed by their interned ids
+		instruments: list[INSTRUMENT_ID] = []
+		for iid in metadata.instruments:
 			if iid not in self.instruments:
-				self._add_new_instrument(iid)
+				iid = self._add_new_instrument(iid)
+			else:
+				iid = intern_instrument_id(iid)
+			instruments.append(iid)
 
 		# Add the strategy to the router
-		view = self.strategy_router.add_strategy(strategy)
+		view = self.strategy_router.add_strategy(strategy, self._ctx)
 
-		# Add all the orderbooks to the view
+		# Add all the orderbooks to the view and rebind the instrument handlers
 		for iid in instruments:
-			view.add_orderbook(iid, self.orderbook_manager.get_orderbook(iid))
+			view.add_orderbook(iid, self._books[iid])
+			self._specialize(iid)
 
 
 	# Market Data Consumption Methods
 	def on_order_book_update_event(self, event: OrderBookUpdateEvent):
 		# Update the orderbook
 		iid = event.instrument_id
-		orderbook = self.orderbook_manager.get_orderbook(iid)
-		for delta in event.deltas:
-			orderbook.adjust_volume(
-				delta.price,
-				delta.size_delta,
-				delta.side,
-			)
+		self._books[iid].apply_deltas(event.deltas)
 
 		# Notify strategies and collect orders
-		context = self._build_context()
-		for strategy in self.strategy_router.get_strategies_to_run(iid):
-			orders = strategy.on_order_book_change(iid, orderbook, context)
-			self._send_orders(orders)
-		
+		self._book_change_dispatch[iid]()
 
 	def on_trade_event(self, event: TradeEvent):
-		iid = event.instrument_id
-		orderbook = self.orderbook_manager.get_orderbook(iid)
-		trade_data = TradeData(
-			instrument_id=iid,
-			price=event.price,
-			size=event.size,
-			side=event.side,
-		)
-
-		# Notify strategies and collect orders
-		context = self._build_context()
-		for strategy in self.strategy_router.get_strategies_to_run(iid):
-			orders = strategy.on_trade(iid, trade_data, orderbook, context)
-			self._send_orders(orders)
+		self._trade_dispatch[event.instrument_id](event)
 
 	def on_order_book_snapshot_event(self, event: OrderBookSnapshotEvent):
-		# Populate the orderbook
-		iid = event.instrument_id
-		
 		# Populate the orderbook with snapshot data
-		orderbook = self.orderbook_manager.get_orderbook(iid)
-		orderbook.populate(
-			bids=[(bid.price, bid.size) for bid in event.bids],
-			asks=[(ask.price, ask.size) for ask in event.asks],
+		iid = event.instrument_id
+		self._books[iid].populate(
+			bids=_level_pairs(event.bids),
+			asks=_level_pairs(event.asks),
 		)
 
 		self.instruments[iid].is_tradable = True
 
-		context = self._build_context()
-		for strategy in self.strategy_router.get_strategies_to_run(iid):
-			orders = strategy.on_order_book_change(iid, orderbook, context)
-			self._send_orders(orders)
+		# Same fan-out as an incremental update
+		self._book_change_dispatch[iid]()
 
 
 	# Private methods
@@ -185,10 +242,10 @@ class Channel(ChannelInterface, MarketDataConsumer):
 		Raises:
 			ChannelStateError: Always raised with the provided message
 		"""
-		self.status = ChannelStatus.ERROR
+		self._status = STATUS_ERROR
 		raise ChannelStateError(msg)
 
-	def _add_new_instrument(self, iid: INSTRUMENT_ID) -> None:
+	def _add_new_instrument(self, iid: INSTRUMENT_ID) -> INSTRUMENT_ID:
 		"""
 		Register a new instrument with the channel.
 		
@@ -197,17 +254,25 @@ class Channel(ChannelInterface, MarketDataConsumer):
 		2. Creates an orderbook for the instrument
 		3. Subscribes to market data for the instrument
 		4. Tracks the instrument in the channel's registry
+
+		The id is interned so hot path dict lookups with ids interned by the
+		IML short-circuit on identity instead of comparing the full strings.
 		
 		Args:
 			iid: Instrument ID to register
+
+		Returns:
+			The interned instrument ID used as the key in every channel map
 			
 		Raises:
 			ChannelStateError: If the channel is not in INITIALIZED state
 		"""
-		if self.status != ChannelStatus.INITIALIZED:
+		if self._status != STATUS_INITIALIZED:
 			msg = f"Instruments can only be added during initialisation phase. Current status={self.status}"
 			self._throw_channel_error(msg)
 
+		iid = intern_instrument_id(iid)
+
 		# Create an orderbook for this instrument
 		self.orderbook_manager.create_orderbook(iid)
 
@@ -216,28 +281,50 @@ class Channel(ChannelInterface, MarketDataConsumer):
 
 		# Track instrument (not yet tradable until we receive snapshot)
 		self.instruments[iid] = InstrumentWrapper(iid, False)
+		self._specialize(iid)
+		return iid
+
+	def _specialize(self, iid: INSTRUMENT_ID) -> None:
+		"""
+		Build the event handlers for a single instrument.
+
+		The orderbook, the routes, the context and the order sink are bound as
+		closure cells, so per event the handlers only touch locals. Must be
+		called again whenever the instrument's routes change.
+
+		Args:
+			iid: Instrument ID to build handlers for
+		"""
+		orderbook = self._books[iid]
+		routes = self.strategy_router.get_strategies_to_run(iid)
+		context = self._ctx
+		send_orders = self._send_orders
+
+		def on_trade(event: TradeEvent) -> None:
+			trade_data = TradeData(iid, event.price, event.size, event.side)
+			for strategy in routes:
+				send_orders(strategy.on_trade(iid, trade_data, orderbook, context))
+
+		def on_book_change() -> None:
+			for strategy in routes:
+				send_orders(strategy.on_order_book_change(iid, orderbook, context))
+
+		self._trade_dispatch[iid] = on_trade
+		self._book_change_dispatch[iid] = on_book_change
 	
 	def _send_orders(self, orders: list[OrderRequest]) -> None:
 		"""
 		Send a batch of orders to the execution link.
+
+		With an order ring the handler only publishes the orders; the sender
+		thread submits them to the execution link.
 		
 		Args:
 			orders: List of order requests to send
 		"""
 		if not orders:
 			return
-			
+
+		send = self._order_handler
 		for order in orders:
-			try:
-				self.eml.send_order(order)
-			except Exception as e:
-				raise e
-	
-	def _build_context(self) -> ContextProvider:
-		"""
-		Build a context object for strategy execution.
-		
-		Returns:
-			ContextProvider instance for use by strategies
-		"""
-		return self.context_builder.build_context({})
+			send(order)
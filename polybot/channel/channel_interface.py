@@ -1,24 +1,27 @@
-from typing import Protocol
+from abc import ABC, abstractmethod
 
 from polybot.strategy import StrategyBase
 
-class ChannelInterface(Protocol):
+class ChannelInterface(ABC):
+	__slots__ = ()
+
+	@abstractmethod
 	def run(self):
 		"""
 		Starts the channel
 		"""
 		...
 	
+	@abstractmethod
 	def stop(self):
 		"""
 		Stops the channel
 		"""
 		...
 
+	@abstractmethod
 	def add_strategy(self, strategy: StrategyBase):
 		"""
 		Adds a strategy to the channel
 		"""
 		...
-
-	
\ No newline at end of file
@@ -9,6 +9,11 @@ class IOrderBookWriter(Protocol):
 
 
 class IOrderBookReader(Protocol):
+	@property
+	def books(self) -> dict[INSTRUMENT_ID, OrderBook]:
+		"""The live backing dict, for callers that index it on the hot path."""
+		...
+
 	def get_orderbook(self, instrument_id: INSTRUMENT_ID) -> OrderBook:
 		...
 
@@ -20,6 +25,11 @@ class OrderBookManager(IOrderBookWriter, IOrderBookReader):
 	def create_orderbook(self, instrument_id: INSTRUMENT_ID):
 		self.orderbooks[instrument_id] = OrderBook()
 
+	@property
+	def books(self) -> dict[INSTRUMENT_ID, OrderBook]:
+		"""The live backing dict, for callers that index it on the hot path."""
+		return self.orderbooks
+
 	def get_orderbook(self, instrument_id: INSTRUMENT_ID) -> OrderBook:
 		return self.orderbooks[instrument_id]
 
@@ -0,0 +1,197 @@
+"""
+Order Ring - Decouples strategy fan-out from order submission.
+
+The market data thread publishes orders into a bounded, preallocated ring and
+a dedicated sender thread drains them into the execution link. The critical
+path therefore ends at a slot write instead of at the exchange round trip.
+
+The ring is single-producer/single-consumer: only the channel publishes and
+only the OrderSender drains. Each index is written by exactly one side, which
+is all the ordering the GIL needs to give us.
+
+An order the sender fails to send cannot raise into the strategy that sent
+it, so the failure is handed back through the ring: the next publish, or
+OrderSender.stop, raises it as an OrderSendError.
+"""
+
+import logging
+import threading
+from typing import Optional, cast
+
+from polybot.common.exceptions import OrderRingFullError, OrderSendError
+from polybot.common.types import OrderRequest
+from polybot.eml import ExecLink
+
+logger = logging.getLogger(__name__)
+
+
+class OrderRing:
+	"""Fixed-capacity SPSC ring buffer of outgoing orders."""
+
+	def __init__(self, capacity: int = 1024):
+		if capacity <= 0:
+			raise ValueError(f"OrderRing capacity must be positive, got {capacity}")
+
+		self._capacity = capacity
+		self._slots: list[Optional[OrderRequest]] = [None] * capacity
+
+		# Monotonic counters; the slot index is counter % capacity
+		self._head = 0 # Next slot to drain (consumer owned)
+		self._tail = 0 # Next slot to publish (producer owned)
+
+		self._ready = threading.Event()
+
+		# First send failure the producer has not been told about yet
+		self._failure: Optional[OrderSendError] = None
+
+	@property
+	def capacity(self) -> int:
+		return self._capacity
+
+	def __len__(self) -> int:
+		return self._tail - self._head
+
+	def publish(self, order: OrderRequest) -> None:
+		"""
+		Write an order into the next free slot.
+
+		Raises:
+			OrderSendError: If an earlier order failed to send. This order is
+				not published.
+			OrderRingFullError: If the consumer has fallen a full ring behind
+		"""
+		if self._failure is not None:
+			self.raise_failure()
+
+		tail = self._tail
+		if tail - self._head >= self._capacity:
+			raise OrderRingFullError(f"Order ring is full (capacity={self._capacity})")
+
+		self._slots[tail % self._capacity] = order
+		self._tail = tail + 1
+		self._ready.set()
+
+	def drain(self, max_items: int = 64) -> list[OrderRequest]:
+		"""Take up to max_items published orders, oldest first."""
+		slots = self._slots
+		capacity = self._capacity
+		head = self._head
+		count = min(self._tail - head, max_items)
+		if count <= 0:
+			return []
+
+		# The published slots are one run, or two when they wrap past the end
+		start = head % capacity
+		stop = start + count
+		if stop <= capacity:
+			batch = slots[start:stop]
+			slots[start:stop] = [None] * count
+		else:
+			stop -= capacity
+			batch = slots[start:] + slots[:stop]
+			slots[start:] = [None] * (capacity - start)
+			slots[:stop] = [None] * stop
+
+		self._head = head + count
+		# Every slot between head and tail holds a published order
+		return cast(list[OrderRequest], batch)
+
+	def wait(self, timeout: Optional[float] = None) -> bool:
+		"""Block until an order may be available. Returns False on timeout."""
+		return self._ready.wait(timeout)
+
+	def clear_ready(self) -> None:
+		"""Reset the wakeup flag. Must be called before draining, not after."""
+		self._ready.clear()
+
+	def wake(self) -> None:
+		"""Wake a consumer blocked in wait() without publishing an order."""
+		self._ready.set()
+
+	def report_failure(self, order: OrderRequest, exc: Exception) -> None:
+		"""Hand a failed send back to the producer. Only the first pending failure is kept."""
+		if self._failure is None:
+			failure = OrderSendError(f"Failed to send order {order}")
+			failure.__cause__ = exc
+			self._failure = failure
+
+	def raise_failure(self) -> None:
+		"""Raise the pending send failure, if any, and clear it."""
+		failure = self._failure
+		if failure is not None:
+			self._failure = None
+			raise failure
+
+
+class OrderSender:
+	"""Drains an OrderRing into an ExecLink on a dedicated thread."""
+
+	def __init__(
+		self,
+		ring: OrderRing,
+		eml: ExecLink,
+		batch_size: int = 64,
+		idle_timeout: float = 0.1,
+	):
+		self._ring = ring
+		self._eml = eml
+		self._batch_size = batch_size
+		self._idle_timeout = idle_timeout
+
+		self._running = False
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def is_running(self) -> bool:
+		return self._running
+
+	def start(self) -> None:
+		"""Start the sender thread. No-op if it is already running."""
+		if self._running:
+			return
+
+		self._running = True
+		self._thread = threading.Thread(target=self._run, name="polybot-order-sender", daemon=True)
+		self._thread.start()
+
+	def stop(self) -> None:
+		"""
+		Stop the sender thread after flushing every published order.
+
+		Raises:
+			OrderSendError: If an order failed to send and no publish has
+				raised it yet
+		"""
+		if not self._running:
+			return
+
+		self._running = False
+		self._ring.wake()
+		if self._thread is not None:
+			self._thread.join()
+			self._thread = None
+
+		# Anything published while the thread was shutting down
+		self._send_batch(self._ring.drain(len(self._ring)))
+		self._ring.raise_failure()
+
+	def _run(self) -> None:
+		ring = self._ring
+		batch_size = self._batch_size
+
+		while self._running:
+			ring.clear_ready()
+			batch = ring.drain(batch_size)
+			if batch:
+				self._send_batch(batch)
+			else:
+				ring.wait(self._idle_timeout)
+
+	def _send_batch(self, batch: list[OrderRequest]) -> None:
+		send_order = self._eml.send_order
+		for order in batch:
+			try:
+				send_order(order)
+			except Exception as exc:
+				logger.exception(f"Failed to send order {order}")
+				self._ring.report_failure(order, exc)
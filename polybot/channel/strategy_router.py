@@ -1,31 +1,67 @@
-from polybot.common.types import INSTRUMENT_ID
+from polybot.common.types import INSTRUMENT_ID, intern_instrument_id
+from polybot.common.exceptions import ChannelStateError
+from polybot.common.context_provider import ContextProvider
 from polybot.strategy import StrategyInterface
 from polybot.channel.strategy_view import StrategyView
-from collections import defaultdict
-from typing import Generator
+from typing import Mapping, Sequence
 
 """
 StrategyRouter is responsible for:
  - Add a strategy and the instruments it cares about
  - For a given instrument, return all strategies that care about it
+
+Strategies are only added while the owning channel initialises. freeze() is
+called once the channel starts running; it copies every fan-out list into a
+tuple and rejects any further add_strategy.
 """
 
 class StrategyRouter:
 	def __init__(self):
 		self.strategy_views: list[StrategyView] = []
-		self.strategies: dict[INSTRUMENT_ID, list[int]] = defaultdict(list)
+		# Instrument -> views to run, built up by add_strategy until frozen
+		self.strategies: dict[INSTRUMENT_ID, list[StrategyView]] = {}
+		# Tuple copy of strategies, filled in by freeze()
+		self.frozen_strategies: dict[INSTRUMENT_ID, tuple[StrategyView, ...]] = {}
+		self._frozen = False
+
+	@property
+	def fanout(self) -> Mapping[INSTRUMENT_ID, Sequence[StrategyView]]:
+		"""The instrument -> views table currently in use, the tuples once frozen."""
+		return self.frozen_strategies if self._frozen else self.strategies
+
+	@property
+	def is_frozen(self) -> bool:
+		return self._frozen
 
-	def add_strategy(self, strategy: StrategyInterface) -> StrategyView:
-		strategy_view = StrategyView(strategy)
+	def add_strategy(self, strategy: StrategyInterface, context: ContextProvider) -> StrategyView:
+		if self._frozen:
+			raise ChannelStateError("Strategies cannot be added after the router is frozen")
+
+		strategy_view = StrategyView(strategy, context)
 		self.strategy_views.append(strategy_view)
-		strategy_id = len(self.strategy_views) - 1
 		for iid in strategy.get_metadata().instruments:
-			self.strategies[iid].append(strategy_id)
+			# Interned to match the ids the channel and IML look up with
+			iid = intern_instrument_id(iid)
+			self.strategies.setdefault(iid, []).append(strategy_view)
 		return strategy_view
 
-	def get_strategies(self, iid: INSTRUMENT_ID) -> list[StrategyView]:
-		return [self.strategy_views[strategy_id] for strategy_id in self.strategies[iid]]
+	def freeze(self) -> None:
+		"""Copy every fan-out list to a tuple. Idempotent."""
+		if self._frozen:
+			return
+
+		frozen = self.frozen_strategies
+		for iid, views in self.strategies.items():
+			frozen[iid] = tuple(views)
+		self._frozen = True
+
+	def get_strategies(self, iid: INSTRUMENT_ID) -> Sequence[StrategyView]:
+		"""
+		The views routed to iid, returned without copying. This is the live
+		list until freeze() and a tuple afterwards; callers must not modify it.
+		"""
+		return self.fanout.get(iid, ())
 
-	def get_strategies_to_run(self, iid: INSTRUMENT_ID) -> Generator[StrategyView, None, None]:
-		for strategy_id in self.strategies[iid]:
-			yield self.strategy_views[strategy_id]
\ No newline at end of file
+	def get_strategies_to_run(self, iid: INSTRUMENT_ID) -> Sequence[StrategyView]:
+		"""The views to run for an event on iid. Same sequence as get_strategies."""
+		return self.fanout.get(iid, ())
\ No newline at end of file
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from polybot.common.orderbook import OrderBook
 from polybot.common.types import INSTRUMENT_ID
 from polybot.strategy import StrategyBase, StrategyInterface, TradeData
@@ -5,12 +7,14 @@ from polybot.common.types import OrderRequest
 from polybot.common.context_provider import ContextProvider
 
 class StrategyView(StrategyInterface):
-    def __init__(self, strategy: StrategyBase):
+    def __init__(self, strategy: StrategyBase, context: ContextProvider):
         self._strategy = strategy
         # Store by ID for lookups, but the value is the reference
         self._books_map: dict[INSTRUMENT_ID, OrderBook] = {}
         # Store as a list for fast iteration in the hot loop
         self._books_list: list[OrderBook] = []
+        # Built once; add_orderbook fills the same map, so it never goes stale
+        self._ctx = replace(context, orderbooks=self._books_map)
 
     def add_orderbook(self, instrument_id: INSTRUMENT_ID, orderbook: OrderBook):
         """Adds the book reference to both the map and the list."""
@@ -32,17 +36,12 @@ class StrategyView(StrategyInterface):
             instrument_id, 
             trade_data, 
             orderbook,
-            self._to_strategy_context(context)
+            self._ctx
         )
 
     def on_order_book_change(self, instrument_id: INSTRUMENT_ID, orderbook: OrderBook, context: ContextProvider) -> list[OrderRequest]:
         return self._strategy.on_order_book_change(
             instrument_id, 
             orderbook,
-            self._to_strategy_context(context)
-        )
-
-
-    def _to_strategy_context(self, context: ContextProvider) -> ContextProvider:
-        context.orderbooks = self._books_map
-        return context
\ No newline at end of file
+            self._ctx
+        )
\ No newline at end of file
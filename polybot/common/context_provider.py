@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from polybot.state import IPositionReader
 from polybot.state import IOrderReader
@@ -7,7 +8,7 @@ from polybot.common.orderbook import OrderBook
 from typing import Mapping
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContextProvider:
 	position_reader: IPositionReader
 	order_reader: IOrderReader
@@ -29,3 +30,11 @@ class ContextBuilder:
 			order_reader=self.order_reader,
 			orderbooks=orderbooks,
 		)
+
+	def build_static_context(self) -> ContextProvider:
+		"""
+		Build a context without orderbooks that can be shared by every event.
+		The readers are live views over the state managers, so the context
+		never goes stale and callers can build it once up front.
+		"""
+		return self.build_context(MappingProxyType({}))
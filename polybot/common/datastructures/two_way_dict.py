@@ -18,11 +18,20 @@ class TwoWayDict:
 		self.backward[value] = key
 
 	def __getitem__(self, key):
-		# Try getting the value from the forward dict, otherwise try getting the key from the backward dict
-		try:
-			return self.forward[key]
-		except KeyError:
-			return self.backward[key]
+		# Try the forward dict, otherwise the backward dict. A membership test
+		# is used instead of catching KeyError so misses don't raise internally.
+		forward = self.forward
+		if key in forward:
+			return forward[key]
+		return self.backward[key]
+
+	def get_forward(self, key):
+		"""Value mapped to key. Raises KeyError if key is not a forward key."""
+		return self.forward[key]
+
+	def get_backward(self, value):
+		"""Key mapped to value. Raises KeyError if value is not a backward key."""
+		return self.backward[value]
 
 	def __delitem__(self, key):
 		# Delete from both dictionaries
@@ -21,4 +21,5 @@ class OrderStatus(Enum):
 	CANCELLED = "cancelled"  						# Order has been cancelled by the user
 	FILLED = "filled"        						# Order has been filled
 	EXPIRED = "expired"      						# Order has expired
+	REJECTED = "rejected"    						# Order could not be placed on the exchange
 
@@ -1,5 +1,7 @@
-from .channel import ChannelStateError
+from .channel import ChannelStateError, OrderRingFullError, OrderSendError
 
 __all__ = [
 	"ChannelStateError",
+	"OrderRingFullError",
+	"OrderSendError",
 ]
@@ -3,3 +3,9 @@ class ChannelError(Exception):
 
 class ChannelStateError(ChannelError):
 	pass
+
+class OrderRingFullError(ChannelError):
+	pass
+
+class OrderSendError(ChannelError):
+	pass
\ No newline at end of file
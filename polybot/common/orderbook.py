@@ -1,9 +1,31 @@
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import Optional, Tuple
+from operator import attrgetter, mul
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
 from polybot.common.enums import Side
 
-@dataclass
+if TYPE_CHECKING:
+    from polybot.iml.messages import LevelDelta
+
+_get_price = attrgetter("price")
+_get_volume = attrgetter("volume")
+
+
+# A batch is merged into the book in one pass, rather than applied delta by
+# delta, once it has at least this many deltas and more than
+# _MERGE_BOOK_RATIO deltas per resting level. Below that the targeted inserts
+# and removals are cheaper than rebuilding a side.
+_MERGE_BATCH_SIZE = 32
+_MERGE_BOOK_RATIO = 2
+
+
+def _head(levels: list, n: int) -> list:
+    """First n levels, or all of them when n <= 0. Only copies a true prefix."""
+    return levels[:n] if 0 < n < len(levels) else levels
+
+
+@dataclass(slots=True)
 class Level:
     price: float
     volume: float
@@ -16,6 +38,23 @@ class Level:
 class OrderBook:
     bids: list[Level] = field(default_factory=list)  # Descending order
     asks: list[Level] = field(default_factory=list)  # Ascending order
+
+    # Sorted search keys parallel to bids/asks. Bid keys are negated prices so
+    # both sides are ascending and can be searched with bisect.
+    _bid_keys: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+    _ask_keys: list[float] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    # Index of the last level touched on each side. Updates cluster around the
+    # same prices, so this is checked before falling back to a bisect.
+    _last_bid_index: int = field(default=0, init=False, repr=False, compare=False)
+    _last_ask_index: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Cached midpoint, dropped whenever a top-of-book level is inserted or removed
+    _mid: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _mid_valid: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._rebuild_keys()
     
     def best_bid(self) -> Optional[Level]:
         return self.bids[0] if self.bids else None
@@ -25,17 +64,26 @@ class OrderBook:
     
     def spread(self) -> float:
         """Returns the bid-ask spread, or 0 if book is incomplete"""
-        bb, ba = self.best_bid(), self.best_ask()
-        return (ba.price - bb.price) if (bb and ba) else 0.0
+        bids, asks = self.bids, self.asks
+        return (asks[0].price - bids[0].price) if (bids and asks) else 0.0
     
     def spread_bps(self) -> float:
         """Returns spread in basis points relative to midpoint"""
-        mid = self.midpoint()
-        return (self.spread() / mid * 10000) if mid > 0 else 0.0
+        bids, asks = self.bids, self.asks
+        if not (bids and asks):
+            return 0.0
+        bid, ask = bids[0].price, asks[0].price
+        mid = (bid + ask) / 2
+        return ((ask - bid) / mid * 10000) if mid > 0 else 0.0
     
     def midpoint(self) -> Optional[float]:
-        bb, ba = self.best_bid(), self.best_ask()
-        return ((bb.price + ba.price) / 2) if (bb and ba) else None
+        if self._mid_valid:
+            return self._mid
+
+        bids, asks = self.bids, self.asks
+        self._mid = ((bids[0].price + asks[0].price) / 2) if (bids and asks) else None
+        self._mid_valid = True
+        return self._mid
     
     def vwap(self, levels: int = 0) -> Optional[float]:
         """
@@ -43,9 +91,8 @@ class OrderBook:
         levels == 0 implies all levels.
         Returns None if orderbook is empty.
         """
-        n = levels if levels > 0 else None
-        bid_vol, bid_weighted = self._calculate_vwap_side(self.bids[:n])
-        ask_vol, ask_weighted = self._calculate_vwap_side(self.asks[:n])
+        bid_vol, bid_weighted = self._calculate_vwap_side(_head(self.bids, levels))
+        ask_vol, ask_weighted = self._calculate_vwap_side(_head(self.asks, levels))
         
         total_vol = bid_vol + ask_vol
         if total_vol == 0:
@@ -55,8 +102,8 @@ class OrderBook:
     
     def _calculate_vwap_side(self, levels: list[Level]) -> Tuple[float, float]:
         """Returns (total_volume, weighted_sum). Optimized iteration."""
-        total_vol = sum(lvl.volume for lvl in levels)
-        weighted_sum = sum(lvl.price * lvl.volume for lvl in levels)
+        total_vol = sum(map(_get_volume, levels))
+        weighted_sum = sum(map(mul, map(_get_price, levels), map(_get_volume, levels)))
         return total_vol, weighted_sum
     
     def depth(self, price: float, side: Side) -> float:
@@ -64,10 +111,12 @@ class OrderBook:
         Calculate total volume available up to a given price.
         side: 'bid' or 'ask'
         """
+        # Sides are sorted, so the qualifying levels are a prefix found by bisect
         if side == Side.BUY:
-            return sum(lvl.volume for lvl in self.bids if lvl.price >= price)
+            levels, n = self.bids, bisect_right(self._bid_keys, -price)
         else:
-            return sum(lvl.volume for lvl in self.asks if lvl.price <= price)
+            levels, n = self.asks, bisect_right(self._ask_keys, price)
+        return sum(map(_get_volume, levels[:n] if n < len(levels) else levels))
     
     def impact_price(self, volume: float, side: Side) -> Optional[float]:
         """
@@ -80,11 +129,14 @@ class OrderBook:
         weighted_sum = 0.0
         
         for lvl in levels:
-            if remaining <= 0:
+            lvl_volume = lvl.volume
+            if remaining <= lvl_volume:
+                # This level fills the rest of the order
+                weighted_sum += remaining * lvl.price
+                remaining = 0
                 break
-            taken = min(remaining, lvl.volume)
-            weighted_sum += taken * lvl.price
-            remaining -= taken
+            weighted_sum += lvl_volume * lvl.price
+            remaining -= lvl_volume
         
         if remaining > 0:
             return None  # Insufficient liquidity
@@ -106,9 +158,8 @@ class OrderBook:
     
     def total_volume(self, levels: int = 0) -> Tuple[float, float]:
         """Returns (bid_volume, ask_volume) for first N levels"""
-        n = levels if levels > 0 else None
-        bid_vol = sum(lvl.volume for lvl in self.bids[:n])
-        ask_vol = sum(lvl.volume for lvl in self.asks[:n])
+        bid_vol = sum(map(_get_volume, _head(self.bids, levels)))
+        ask_vol = sum(map(_get_volume, _head(self.asks, levels)))
         return bid_vol, ask_vol
     
     def imbalance(self, levels: int = 5) -> float:
@@ -120,14 +171,21 @@ class OrderBook:
         total = bid_vol + ask_vol
         return ((bid_vol - ask_vol) / total) if total > 0 else 0.0
     
-    def populate(self, bids: list[tuple[float, float]], asks: list[tuple[float, float]]):
+    def populate(self, bids: Iterable[tuple[float, float]], asks: Iterable[tuple[float, float]]):
         """
         Populate orderbook from raw data.
-        Bids: list[(price, volume), ...] - will be sorted descending
-        Asks: list[(price, volume), ...] - will be sorted ascending
+        Bids: iterable of (price, volume) - will be sorted descending
+        Asks: iterable of (price, volume) - will be sorted ascending
+        Any iterable works, so callers can stream pairs without building a list.
         """
-        self.bids = sorted([Level(p, v) for p, v in bids], reverse=True)
-        self.asks = sorted([Level(p, v) for p, v in asks])
+        bid_levels = [Level(p, v) for p, v in bids]
+        bid_levels.sort(reverse=True)
+        ask_levels = [Level(p, v) for p, v in asks]
+        ask_levels.sort()
+
+        self.bids = bid_levels
+        self.asks = ask_levels
+        self._rebuild_keys()
     
     def update_level(self, price: float, volume: float, side: Side):
         """
@@ -135,35 +193,26 @@ class OrderBook:
         side: 'bid' or 'ask'
         Maintains sorted order.
         """
-        levels = self.bids if side == Side.BUY else self.asks
-        reverse = (side == Side.BUY)
-        
-        # Find existing level
-        for i, lvl in enumerate(levels):
-            if lvl.price == price:
-                if volume == 0:
-                    levels.pop(i)
-                else:
-                    lvl.volume = volume
-                return
-        
-        # Insert new level if volume > 0
-        if volume > 0:
-            new_level = Level(price, volume)
-            if reverse:
-                # For bids: insert in descending order
-                for i, lvl in enumerate(levels):
-                    if price > lvl.price:
-                        levels.insert(i, new_level)
-                        return
-                levels.append(new_level)
+        levels, keys, key, i, found = self._locate(price, side)
+
+        if found:
+            if volume == 0:
+                levels.pop(i)
+                keys.pop(i)
+                if i == 0:
+                    self._mid_valid = False
             else:
-                # For asks: insert in ascending order
-                for i, lvl in enumerate(levels):
-                    if price < lvl.price:
-                        levels.insert(i, new_level)
-                        return
-                levels.append(new_level)
+                levels[i].volume = volume
+        elif volume > 0:
+            # Insert new level if volume > 0
+            levels.insert(i, Level(price, volume))
+            keys.insert(i, key)
+            if i == 0:
+                self._mid_valid = False
+        else:
+            return
+
+        self._remember(side, i)
     
     def adjust_volume(self, price: float, volume_delta: float, side: Side) -> bool:
         """
@@ -175,23 +224,178 @@ class OrderBook:
             ob.adjust_volume(0.52, 100, 'bid')   # Add 100 to bid at 0.52
             ob.adjust_volume(0.52, -50, 'bid')   # Remove 50 from bid at 0.52
         """
-        levels = self.bids if side == Side.BUY else self.asks
-        
-        for i, lvl in enumerate(levels):
-            if lvl.price == price:
-                new_volume = lvl.volume + volume_delta
+        levels, keys, _, i, found = self._locate(price, side)
+        if not found:
+            return False
+
+        lvl = levels[i]
+        new_volume = lvl.volume + volume_delta
+        if new_volume <= 0:
+            levels.pop(i)
+            keys.pop(i)
+            if i == 0:
+                self._mid_valid = False
+        else:
+            lvl.volume = new_volume
+
+        self._remember(side, i)
+        return True
+    
+    def apply_deltas(self, deltas: Iterable["LevelDelta"]):
+        """
+        Apply every level delta of a single book update in one call.
+        Unlike adjust_volume, a positive delta at an unseen price inserts a
+        new level, so the book tracks levels that appear after the snapshot.
+        Levels whose resulting volume is <= 0 are removed; a delta of
+        REMOVE_LEVEL (-inf) therefore always removes its level.
+        Batches much larger than the book are merged in a single pass per side.
+        """
+        if not isinstance(deltas, (list, tuple)):
+            deltas = list(deltas)
+        n = len(deltas)
+        if n >= _MERGE_BATCH_SIZE and n > _MERGE_BOOK_RATIO * (len(self.bids) + len(self.asks)):
+            self._merge_deltas(deltas)
+            return
+
+        locate = self._locate
+        remember = self._remember
+
+        # One search per delta: the located index serves the adjust, the
+        # removal and the insertion cases alike
+        for delta in deltas:
+            price, size_delta, side = delta.price, delta.size_delta, delta.side
+            levels, keys, key, i, found = locate(price, side)
+
+            if found:
+                lvl = levels[i]
+                new_volume = lvl.volume + size_delta
                 if new_volume <= 0:
                     levels.pop(i)
+                    keys.pop(i)
+                    if i == 0:
+                        self._mid_valid = False
                 else:
                     lvl.volume = new_volume
-                return True
-        
-        return False
+            elif size_delta > 0:
+                levels.insert(i, Level(price, size_delta))
+                keys.insert(i, key)
+                if i == 0:
+                    self._mid_valid = False
+            else:
+                continue
+
+            remember(side, i)
     
+    def _merge_deltas(self, deltas: Iterable["LevelDelta"]):
+        """
+        Apply a batch by folding the deltas per price, then merging the
+        surviving new levels and dropping the emptied ones in one rebuild of
+        each side. The result matches applying the deltas one at a time.
+        """
+        # price -> (index in the current side or -1, running volume or None)
+        bid_changes: dict[float, tuple[int, Optional[float]]] = {}
+        ask_changes: dict[float, tuple[int, Optional[float]]] = {}
+
+        for delta in deltas:
+            price, size_delta = delta.price, delta.size_delta
+            if delta.side == Side.BUY:
+                changes, levels, keys, key = bid_changes, self.bids, self._bid_keys, -price
+            else:
+                changes, levels, keys, key = ask_changes, self.asks, self._ask_keys, price
+
+            entry = changes.get(price)
+            if entry is None:
+                i = bisect_left(keys, key)
+                if i < len(keys) and keys[i] == key:
+                    entry = (i, levels[i].volume)
+                else:
+                    entry = (-1, None)
+
+            i, volume = entry
+            if volume is not None:
+                volume += size_delta
+                if volume <= 0:
+                    volume = None
+            elif size_delta > 0:
+                volume = size_delta
+            changes[price] = (i, volume)
+
+        # Keys only need rebuilding when a side gained or lost levels
+        bids = self._merge_side(self.bids, bid_changes, True)
+        asks = self._merge_side(self.asks, ask_changes, False)
+        if bids is not None or asks is not None:
+            if bids is not None:
+                self.bids = bids
+            if asks is not None:
+                self.asks = asks
+            self._rebuild_keys()
+
+    @staticmethod
+    def _merge_side(levels: list[Level], changes: dict[float, tuple[int, Optional[float]]], descending: bool) -> Optional[list[Level]]:
+        """
+        Write folded volumes back onto one side. Returns the rebuilt side in
+        sorted order, or None when only volumes changed in place.
+        """
+        added: list[Level] = []
+        removed: set[int] = set()
+        for price, (i, volume) in changes.items():
+            if i >= 0:
+                if volume is None:
+                    removed.add(i)
+                else:
+                    levels[i].volume = volume
+            elif volume is not None:
+                added.append(Level(price, volume))
+
+        if not (removed or added):
+            return None
+
+        if removed:
+            levels = [lvl for j, lvl in enumerate(levels) if j not in removed]
+        if added:
+            # Both runs are already sorted, so this sort is a linear merge
+            added.sort(key=_get_price, reverse=descending)
+            levels = levels + added
+            levels.sort(key=_get_price, reverse=descending)
+        return levels
+
     def clear(self):
         """Clear all levels from the orderbook"""
         self.bids.clear()
         self.asks.clear()
+        self._bid_keys.clear()
+        self._ask_keys.clear()
+        self._mid_valid = False
+
+    def _rebuild_keys(self):
+        """Derive the search keys from the current levels and drop the cached mid."""
+        self._bid_keys = [-price for price in map(_get_price, self.bids)]
+        self._ask_keys = list(map(_get_price, self.asks))
+        self._mid_valid = False
+
+    def _locate(self, price: float, side: Side) -> Tuple[list[Level], list[float], float, int, bool]:
+        """
+        Find where price sits on one side of the book.
+        Returns (levels, keys, key, index, found). When not found, index is
+        the insertion point that keeps the side sorted.
+        """
+        if side == Side.BUY:
+            levels, keys, key, i = self.bids, self._bid_keys, -price, self._last_bid_index
+        else:
+            levels, keys, key, i = self.asks, self._ask_keys, price, self._last_ask_index
+
+        # Path cache: the last touched level is the most likely to be hit again
+        if i < len(keys) and keys[i] == key:
+            return levels, keys, key, i, True
+
+        i = bisect_left(keys, key)
+        return levels, keys, key, i, i < len(keys) and keys[i] == key
+
+    def _remember(self, side: Side, index: int):
+        if side == Side.BUY:
+            self._last_bid_index = index
+        else:
+            self._last_ask_index = index
     
     def __repr__(self) -> str:
         bb = self.best_bid()
@@ -1,3 +1,5 @@
+import sys
+
 from pydantic import BaseModel
 from typing import Union
 
@@ -7,6 +9,11 @@ from .enums import Side, OrderType, OrderStatus
 # Polymarket uses string token IDs (e.g., "0x1234...")
 INSTRUMENT_ID = Union[int, str]
 
+
+def intern_instrument_id(instrument_id: INSTRUMENT_ID) -> INSTRUMENT_ID:
+	"""Intern string ids so dict lookups can match on identity. Int ids pass through."""
+	return sys.intern(instrument_id) if isinstance(instrument_id, str) else instrument_id
+
 ORDER_ID = int
 FAILED_ORDER_ID = -1 # A special value to indicate that an order failed to be sent
 
@@ -1,3 +1,6 @@
+from concurrent.futures import Future
+from functools import partial
+
 from polybot.common.types import FAILED_ORDER_ID, ORDER_ID
 from polybot.common.types import OrderRequest
 from polybot.limits import ILimitStore
@@ -30,17 +33,28 @@ class ExecutionLink(ExecLink, ExecLinkHandler):
 		if not limit_result.allowed:
 			return FAILED_ORDER_ID
 
-		self._gem.send_order(order)
+		post = self._gem.send_order(order)
 
-		return self._handler.post_send_order(order)
+		# Recorded before returning, so the order is readable as soon as the caller has its id
+		order_id = self._handler.post_send_order(order)
+		if post is not None:
+			# Attached after recording: a post that has already failed runs the
+			# callback here, so the order is always recorded before it is rejected
+			post.add_done_callback(partial(self._on_post_done, order_id, order))
+		return order_id
 	
 	def cancel_order(self, order_id: ORDER_ID):
+		# Raises KeyError for an order id that was never sent
 		exchange_order_id = self._order_manager.get_exchange_order_id_from_order_id(order_id)
 
 		self._gem.cancel_order(exchange_order_id)
 
 		self._handler.post_cancel_order(order_id)
 
+	def stop(self):
+		"""Stop the exchange link once the channel has stopped sending orders."""
+		self._gem.stop()
+
 	# ExecLinkHandler Methods: Orders have been sent, we are now out of the critical path
 	def post_send_order(self, order: OrderRequest) -> ORDER_ID:
 		order_id = self._order_manager.add_order(order)
@@ -48,4 +62,17 @@ class ExecutionLink(ExecLink, ExecLinkHandler):
 		return order_id
 
 	def post_cancel_order(self, order_id: ORDER_ID):
-		self._order_manager.cancel_requested(order_id)
\ No newline at end of file
+		self._order_manager.cancel_requested(order_id)
+
+	def post_send_failed(self, order_id: ORDER_ID, order: OrderRequest):
+		self._order_manager.order_rejected(order_id)
+		self._limit_store.release_reserved_capacity(
+			order.instrument_id,
+			order.side,
+			order.quantity,
+			order.price,
+		)
+
+	def _on_post_done(self, order_id: ORDER_ID, order: OrderRequest, post: Future):
+		if post.cancelled() or post.exception() is not None:
+			self._handler.post_send_failed(order_id, order)
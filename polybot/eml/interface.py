@@ -1,4 +1,5 @@
-from typing import Protocol
+from concurrent.futures import Future
+from typing import Optional, Protocol
 
 from polybot.common.types import ORDER_ID
 from polybot.common.types import OrderRequest
@@ -10,6 +11,10 @@ class ExecLink(Protocol):
 	def cancel_order(self, order_id: ORDER_ID):
 		...
 
+	def stop(self):
+		"""Release the link's resources on shutdown, after the last order is sent."""
+		...
+
 
 class ExecLinkHandler(Protocol):
 	def post_send_order(self, order: OrderRequest) -> ORDER_ID:
@@ -18,11 +23,22 @@ class ExecLinkHandler(Protocol):
 	def post_cancel_order(self, order_id: ORDER_ID):
 		...
 
+	def post_send_failed(self, order_id: ORDER_ID, order: OrderRequest):
+		"""An order recorded by post_send_order never reached the exchange"""
+		...
+
 
 class IGenericExchangeLink(Protocol):
-	def send_order(self, order: OrderRequest):
+	def send_order(self, order: OrderRequest) -> Optional[Future]:
+		"""
+		Send an order to the exchange. Links that post asynchronously return a
+		Future that fails if the post does; the others return None.
+		"""
 		...
 
 	def cancel_order(self, exchange_order_id: str):
 		...
 
+	def stop(self):
+		...
+
@@ -12,10 +12,10 @@ class InstrumentDefinitionStore(IInstrumentDefintionStore):
 	def get_instrument_id(self, venue: Venue, exchange_id: str) -> INSTRUMENT_ID:
 		id_mapping = self.venue_store.get(venue)
 
-		return id_mapping[exchange_id]
+		return id_mapping.get_backward(exchange_id)
 
 	def get_exchange_id(self, venue: Venue, instrument_id: INSTRUMENT_ID) -> str:
 		id_mapping = self.venue_store.get(venue)
 
-		return id_mapping[instrument_id]
+		return id_mapping.get_forward(instrument_id)
 
@@ -1,6 +1,6 @@
 from .iml_base import ImlBase
 from .interface import MarketDataProvider, MarketDataConsumer
-from .messages import MarketEventType, OrderBookSnapshotEvent, OrderBookUpdateEvent, TradeEvent, LevelDelta, Level
+from .messages import MarketEventType, OrderBookSnapshotEvent, OrderBookUpdateEvent, TradeEvent, LevelDelta, Level, REMOVE_LEVEL
 
 __all__ = [
 	'MarketDataProvider',
@@ -12,4 +12,5 @@ __all__ = [
 	'LevelDelta',
 	'ImlBase',
 	'Level',
+	'REMOVE_LEVEL',
 ]
@@ -0,0 +1,86 @@
+"""
+DeltaCache - Turns absolute level sizes into deltas.
+
+Venues that publish the new size of a level, rather than the change, keep
+the last size of every level here. Prices and sizes are ints so the lookups
+and the subtraction stay cheap; the module is kept free of dynamic features
+and fully annotated so it can be compiled (e.g. with mypyc) on its own.
+"""
+
+from typing import Dict
+
+from polybot.common.enums import Side
+
+
+class DeltaCache:
+	"""
+	Tracks the last seen state of orderbook levels to calculate 
+	the difference (delta) between market updates.
+	Prices and sizes are integer ticks; the venue picks the scale.
+	"""
+	def __init__(self) -> None:
+		# Nested mapping: {instrument_id: {Side.BUY: {price: size}, Side.SELL: {price: size}}}
+		self._cache: Dict[str, Dict[Side, Dict[int, int]]] = {}
+
+	def add_instrument(self, instrument_id: str) -> Dict[Side, Dict[int, int]]:
+		"""
+		Creates the per-side maps for an instrument if they do not exist yet.
+		Called on subscribe so the hot path never has to build them.
+		"""
+		sides = self._cache.get(instrument_id)
+		if sides is None:
+			sides = self._cache[instrument_id] = {Side.BUY: {}, Side.SELL: {}}
+		return sides
+
+	def get_sides(self, instrument_id: str) -> Dict[Side, Dict[int, int]]:
+		"""
+		The live per-side maps of an instrument, for callers that apply many
+		updates to it at once. Created if the instrument was never added.
+		"""
+		sides = self._cache.get(instrument_id)
+		if sides is None:
+			# Events for an instrument that was never subscribed
+			sides = self.add_instrument(instrument_id)
+		return sides
+
+	def _levels(self, instrument_id: str, side: Side) -> Dict[int, int]:
+		return self.get_sides(instrument_id)[side]
+
+	def get_last_size(self, instrument_id: str, side: Side, price: int) -> int:
+		"""
+		Retrieves the last known size for a specific price level.
+		Returns 0 if the price level has never been seen or was previously cleared.
+		"""
+		return self._levels(instrument_id, side).get(price, 0)
+
+	def update_size(self, instrument_id: str, side: Side, price: int, new_size: int) -> None:
+		"""
+		Updates the cache with the newest size. 
+		If the size is 0, it removes the price level to save memory.
+		"""
+		levels = self._levels(instrument_id, side)
+		if new_size <= 0:
+			# Level is exhausted/cancelled; pop it to keep the cache lean
+			levels.pop(price, None)
+		else:
+			levels[price] = new_size
+
+	def reset_levels(self, instrument_id: str, side: Side, levels: Dict[int, int]) -> None:
+		"""
+		Replaces every level of one side, e.g. from a snapshot that supersedes
+		all earlier state. levels must only hold positive sizes.
+		"""
+		self.add_instrument(instrument_id)[side] = levels
+
+	def get_delta(self, instrument_id: str, side: Side, price: int, new_size: int) -> int:
+		"""
+		Helper method to calculate the delta and update the cache in one go.
+		Returns: (New Size - Old Size)
+		"""
+		levels = self._levels(instrument_id, side)
+		old_size = levels.get(price, 0)
+		if new_size <= 0:
+			levels.pop(price, None)
+		else:
+			levels[price] = new_size
+		return new_size - old_size
@@ -1,35 +1,83 @@
 from .interface import MarketDataConsumer, MarketDataProvider
 from .messages import MarketEvent, MarketEventType
 
-from polybot.common.types import INSTRUMENT_ID
+from polybot.common.types import INSTRUMENT_ID, intern_instrument_id
 
 from collections import defaultdict
-from typing import Generator
+from operator import attrgetter
+from typing import Callable, Sequence
+
+# Assumed for consumers that do not declare subscribed_events
+ALL_EVENTS: frozenset[MarketEventType] = frozenset(MarketEventType)
+
+# Event type -> getter for the consumer handler of that type
+EVENT_HANDLERS: dict[MarketEventType, Callable[[MarketDataConsumer], Callable[[MarketEvent], None]]] = {
+	MarketEventType.ORDER_BOOK_UPDATE: attrgetter("on_order_book_update_event"),
+	MarketEventType.TRADE: attrgetter("on_trade_event"),
+	MarketEventType.ORDER_BOOK_SNAPSHOT: attrgetter("on_order_book_snapshot_event"),
+}
 
 class ImlBase(MarketDataProvider):
 	def __init__(self):
 		self.subscriptions: defaultdict[INSTRUMENT_ID, list[MarketDataConsumer]] = defaultdict(list)
+		self._dispatch = EVENT_HANDLERS
+
+		# (instrument, event type) -> emitter calling every subscriber's handler in order
+		self._emitters: dict[tuple[INSTRUMENT_ID, MarketEventType], Callable[[MarketEvent], None]] = {}
 
 	def subscribe(self, instrument_id: INSTRUMENT_ID, consumer: MarketDataConsumer):
+		# Interned so lookups with the interned ids venues put on their events match on identity
+		instrument_id = intern_instrument_id(instrument_id)
 		self.subscriptions[instrument_id].append(consumer)
+		self._build_emitters(instrument_id)
 
-	def get_consumers(self, instrument_id: INSTRUMENT_ID) -> Generator[MarketDataConsumer, None, None]:
-		yield from self.subscriptions[instrument_id]
+	def get_consumers(self, instrument_id: INSTRUMENT_ID) -> Sequence[MarketDataConsumer]:
+		"""The live subscribers of instrument_id. Callers must not modify the result."""
+		return self.subscriptions.get(instrument_id, ())
 
 	def emit_message(self, event: MarketEvent):
-		for consumer in self.get_consumers(event.instrument_id):
-			emit_event_to_consumer(event, consumer)
+		emitter = self._emitters.get((event.instrument_id, event.event_type))
+		if emitter is not None:
+			emitter(event)
+		elif event.event_type not in self._dispatch:
+			raise ValueError(f"Unknown event type: {event.event_type}")
 
+	def _build_emitters(self, instrument_id: INSTRUMENT_ID):
+		"""
+		Rebuild the emitters of one instrument from its subscribers.
+		Handlers are bound once here, so emitting an event is one lookup and
+		a straight run of bound-method calls. A consumer only gets the event
+		types in its subscribed_events, and an event type nobody wants has no
+		emitter at all.
+		"""
+		consumers = self.subscriptions[instrument_id]
+		for event_type, get_handler in self._dispatch.items():
+			key = (instrument_id, event_type)
+			handlers = tuple(
+				get_handler(consumer)
+				for consumer in consumers
+				if event_type in getattr(consumer, "subscribed_events", ALL_EVENTS)
+			)
+			if handlers:
+				self._emitters[key] = _make_emitter(handlers)
+			else:
+				self._emitters.pop(key, None)
 
 
-def emit_event_to_consumer(event: MarketEvent, consumer: MarketDataConsumer):
-	match event.event_type:
-		case MarketEventType.ORDER_BOOK_UPDATE:
-			consumer.on_order_book_update_event(event)
-		case MarketEventType.TRADE:
-			consumer.on_trade_event(event)
-		case MarketEventType.ORDER_BOOK_SNAPSHOT:
-			consumer.on_order_book_snapshot_event(event)
-		case _:
-			raise ValueError(f"Unknown event type: {event.event_type}")
 
+def _make_emitter(handlers: tuple[Callable[[MarketEvent], None], ...]) -> Callable[[MarketEvent], None]:
+	# A single subscriber, the common case, needs no loop at all
+	if len(handlers) == 1:
+		return handlers[0]
+
+	def emit(event: MarketEvent):
+		for handler in handlers:
+			handler(event)
+	return emit
+
+
+def emit_event_to_consumer(event: MarketEvent, consumer: MarketDataConsumer):
+	get_handler = EVENT_HANDLERS.get(event.event_type)
+	if get_handler is None:
+		raise ValueError(f"Unknown event type: {event.event_type}")
+	get_handler(consumer)(event)
@@ -1,6 +1,7 @@
-from typing import Protocol
+from typing import ClassVar, Protocol
 
 from .messages import (
+	MarketEventType,
 	TradeEvent,
 	OrderBookSnapshotEvent,
 	OrderBookUpdateEvent,
@@ -9,6 +10,11 @@ from .messages import (
 from polybot.common.types import INSTRUMENT_ID
 
 class MarketDataConsumer(Protocol):
+	__slots__ = ()
+
+	# Event types the provider should deliver; handlers for any other type are never called
+	subscribed_events: ClassVar[frozenset[MarketEventType]] = frozenset(MarketEventType)
+
 	def on_order_book_snapshot_event(self, event: OrderBookSnapshotEvent):
 		"""
 		A full snapshot of the order book at a given point in time
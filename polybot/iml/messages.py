@@ -1,46 +1,53 @@
 from dataclasses import dataclass
-from decimal import Decimal
 from enum import Enum
 from typing import List
 from polybot.common.enums import Side, Venue
 from polybot.common.types import INSTRUMENT_ID
 
+# Prices and sizes are floats, the representation the orderbook and strategies
+# work in. Venues that need exact arithmetic keep it internal to their IML.
+
+# A size_delta that removes the level whatever volume the consumer holds for
+# it. Venues that track absolute sizes send it when a level empties, so float
+# error in the summed deltas can never leave an emptied level in the book.
+REMOVE_LEVEL = float("-inf")
+
 class MarketEventType(Enum):
 	ORDER_BOOK_SNAPSHOT = "ORDER_BOOK_SNAPSHOT"
 	ORDER_BOOK_UPDATE = "ORDER_BOOK_UPDATE"
 	TRADE = "TRADE"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LevelDelta:
-	price: Decimal
-	size_delta: Decimal  # Positive for Add, Negative for Cancel
+	price: float
+	size_delta: float  # Positive for Add, Negative for Cancel, REMOVE_LEVEL to clear
 	side: Side
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Level:
-	price: Decimal
-	size: Decimal
+	price: float
+	size: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
 	venue: Venue
 	instrument_id: INSTRUMENT_ID
 	timestamp: int  # Use Unix ns or ms for faster comparisons than datetime objects
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderBookSnapshotEvent(MarketEvent):
 	bids: List[Level]
 	asks: List[Level]
 	event_type: MarketEventType = MarketEventType.ORDER_BOOK_SNAPSHOT
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderBookUpdateEvent(MarketEvent):
 	deltas: List[LevelDelta]
 	event_type: MarketEventType = MarketEventType.ORDER_BOOK_UPDATE
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeEvent(MarketEvent):
-	price: Decimal
-	size: Decimal
+	price: float
+	size: float
 	side: Side  # The side of the Taker
 	event_type: MarketEventType = MarketEventType.TRADE
@@ -1,14 +1,21 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+
+from pydantic import BaseModel, ConfigDict
 
 from polybot.common.types import INSTRUMENT_ID
 
 class Limit(BaseModel):
+    # Validated once at registration and never mutated afterwards
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     instrument_id: INSTRUMENT_ID
 
     max_position_size: float # Total volume of the instrument that can be held
     max_nominal_position_size: float # Total value of the instrument that can be held
 
 
-class LimitCheckResult(BaseModel):
+# Built in-process for every order attempt, so a plain record rather than a model
+@dataclass(frozen=True, slots=True)
+class LimitCheckResult:
     allowed: bool
     reason: str = ""
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Iterable, Protocol
 
 from polybot.common.types import INSTRUMENT_ID
 from polybot.common.types import Side
@@ -10,6 +10,10 @@ class ILimitStore(Protocol):
         """Register a new limit for a given instrument"""
         ...
 
+    def set_limits(self, items: Iterable[tuple[INSTRUMENT_ID, Limit]]):
+        """Register many (instrument_id, limit) pairs at once"""
+        ...
+
     def try_reserve_capacity(self, instrument_id: INSTRUMENT_ID, side: Side, volume: float, price: float) -> LimitCheckResult:
         """Checks if the order fits; if yes, updates 'in_flight' capacity immediately."""
         ...
@@ -50,3 +54,6 @@ class LimitStore(ILimitStore):
 
     def set_limit(self, instrument_id: INSTRUMENT_ID, limit: Limit):
         self.limits[instrument_id] = limit
+
+    def set_limits(self, items: Iterable[tuple[INSTRUMENT_ID, Limit]]):
+        self.limits.update(items)
@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from py_clob_client import ClobClient
 
 class PolymarketCredentials(BaseModel):
+	model_config = ConfigDict(frozen=True, extra="forbid")
+
 	wallet_private_key: str
 	wallet_address: str
 
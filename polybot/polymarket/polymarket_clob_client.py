@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any
 
 from polybot.common.enums import Side
 
@@ -6,27 +6,36 @@ from py_clob_client import ClobClient
 from py_clob_client.clob_types import OrderType, OrderArgs
 from py_clob_client.order_builder.constants import BUY, SELL
 
+_CLOB_SIDES: dict[Side, str] = {Side.BUY: BUY, Side.SELL: SELL}
+
 def send_order(clob_client: ClobClient, price: float, quantity: float, side: Side, token_id: str):
-	clob_side = internal_side_to_clob_side(side)
+	signed_order = create_signed_order(clob_client, price, quantity, side, token_id)
+	result = post_signed_order(clob_client, signed_order)
+
+
+def create_signed_order(clob_client: ClobClient, price: float, quantity: float, side: Side, token_id: str) -> Any:
+	"""Build and sign an order locally. No network round trip."""
 	order_args = OrderArgs(
 		token_id=token_id,
 		price=price,
 		size=quantity,
-		side=clob_side,
+		side=internal_side_to_clob_side(side),
 	)
 
-	signed_order = clob_client.create_order(order_args)
-	result = clob_client.post_order(signed_order, OrderType.GTD)
+	return clob_client.create_order(order_args)
+
+
+def post_signed_order(clob_client: ClobClient, signed_order: Any):
+	"""Submit a signed order to the exchange. Blocks for the HTTP round trip."""
+	return clob_client.post_order(signed_order, OrderType.GTD)
 
 
 def cancel_order(clob_client: ClobClient, exchange_order_id: str):
 	clob_client.cancel(order_id=exchange_order_id)
 
 
-def internal_side_to_clob_side(side: Side) -> Literal[BUY, SELL]:
-	if side == Side.BUY:
-		return BUY
-	elif side == Side.SELL:
-		return SELL
-	else:
-		raise ValueError(f"Invalid side: {side}")
\ No newline at end of file
+def internal_side_to_clob_side(side: Side) -> str:
+	clob_side = _CLOB_SIDES.get(side)
+	if clob_side is None:
+		raise ValueError(f"Invalid side: {side}")
+	return clob_side
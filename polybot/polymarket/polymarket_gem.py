@@ -1,18 +1,53 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from py_clob_client import ClobClient
+
 from polybot.common.types import OrderRequest
 from polybot.eml import IGenericExchangeLink
 
 from .credentials import PolymarketCredentials
 from .credentials import to_clob_client
 
-from .polymarket_clob_client import send_order
+from .polymarket_clob_client import create_signed_order, post_signed_order
+
+logger = logging.getLogger(__name__)
 
 
 class PolymarketGem(IGenericExchangeLink):
-	def __init__(self, credentials: PolymarketCredentials):
-		self._clob_client = to_clob_client(credentials)
+	def __init__(self, credentials: Optional[PolymarketCredentials] = None, clob_client: Optional[ClobClient] = None):
+		if clob_client is None:
+			if credentials is None:
+				raise ValueError("PolymarketGem needs credentials or a clob_client")
+			clob_client = to_clob_client(credentials)
+		self._clob_client = clob_client
+		# A single worker runs the posts one at a time in submission order, so
+		# the exchange sees orders in the order the strategies sent them, while
+		# the caller never waits on the blocking HTTPS round trip.
+		self._post_worker = ThreadPoolExecutor(
+			max_workers=1,
+			thread_name_prefix="polybot-clob-post",
+		)
 	
-	def send_order(self, order: OrderRequest):
-		send_order(self._clob_client, order.price, order.quantity, order.side, order.instrument_id)
+	def send_order(self, order: OrderRequest) -> Future:
+		# Signing is local and raises on a bad order, so it stays on the caller's
+		# thread; only the round trip is handed to the worker. The returned
+		# Future fails if the post does.
+		signed_order = create_signed_order(self._clob_client, order.price, order.quantity, order.side, order.instrument_id)
+		future = self._post_worker.submit(post_signed_order, self._clob_client, signed_order)
+		future.add_done_callback(_log_post_failure)
+		return future
 
 	def cancel_order(self, exchange_order_id: str):
-		pass
\ No newline at end of file
+		pass
+
+	def stop(self):
+		"""Wait for every queued post to finish, then release the worker."""
+		self._post_worker.shutdown(wait=True)
+
+
+def _log_post_failure(future: Future):
+	exc = future.exception()
+	if exc is not None:
+		logger.error(f"Failed to post order -> {exc!r}")
@@ -5,9 +5,11 @@ from polybot.iml import (
 		TradeEvent as ImlTradeEvent,
 		LevelDelta as ImlLevelDelta,
 		Level as ImlLevel,
+		REMOVE_LEVEL,
 )
 from polybot.common.enums import Venue
 from polybot.common.enums import Side
+from polybot.iml.delta_cache import DeltaCache
 
 from .interfaces import PolymarketMessageHandler
 from .polymarket_ws import PolyMarketWebSocket, IPolymarketWebsocket
@@ -18,9 +20,35 @@ from .types.messages import (
 	LastTradePriceEvent,
 )
 
-from decimal import Decimal
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, Optional
 
+# The DeltaCache tracks prices and sizes as ints on fixed grids. Polymarket
+# quotes on a tick grid no finer than 0.0001 and sizes have at most 6 decimals,
+# so scaling once at parse time is exact and the hot loop is int arithmetic.
+_PRICE_SCALE = 10_000
+_SIZE_SCALE = 1_000_000
+
+
+_get_price = attrgetter("price")
+_get_size = attrgetter("size")
+
+# Wire side -> enum, a dict hit instead of a string compare per row
+_SIDE_MAP: Dict[str, Side] = {"BUY": Side.BUY, "SELL": Side.SELL}
+
+
+# round() of a float already returns an int
+def _price_ticks(price: float) -> int:
+	return round(price * _PRICE_SCALE)
+
+
+def _size_ticks(size: float) -> int:
+	return round(size * _SIZE_SCALE)
+
+
 """
 POLYMARKET API NOTES:
 There are 3 messages that we care about:
@@ -36,53 +64,6 @@ There are 3 messages that we care about:
  a book update event being emitted.
 """
 
-class DeltaCache:
-	"""
-	Tracks the last seen state of orderbook levels to calculate 
-	the difference (delta) between market updates.
-	"""
-	def __init__(self):
-		# Nested mapping: {instrument_id: {Side.BUY: {price: size}, Side.SELL: {price: size}}}
-		self._cache: Dict[str, Dict[Side, Dict[Decimal, Decimal]]] = {}
-
-	def get_last_size(self, instrument_id: str, side: Side, price: Decimal) -> Decimal:
-		"""
-		Retrieves the last known size for a specific price level.
-		Returns 0 if the price level has never been seen or was previously cleared.
-		"""
-		try:
-			return self._cache[instrument_id][side].get(price, Decimal("0"))
-		except KeyError:
-			# Initialize instrument/side maps if they don't exist
-			if instrument_id not in self._cache:
-				self._cache[instrument_id] = {Side.BUY: {}, Side.SELL: {}}
-			return Decimal("0")
-
-	def update_size(self, instrument_id: str, side: Side, price: Decimal, new_size: Decimal):
-		"""
-		Updates the cache with the newest size. 
-		If the size is 0, it removes the price level to save memory.
-		"""
-		if instrument_id not in self._cache:
-			self._cache[instrument_id] = {Side.BUY: {}, Side.SELL: {}}
-			
-		if new_size <= 0:
-			# Level is exhausted/cancelled; pop it to keep the cache lean
-			self._cache[instrument_id][side].pop(price, None)
-		else:
-			self._cache[instrument_id][side][price] = new_size
-
-	def get_delta(self, instrument_id: str, side: Side, price: Decimal, new_size: Decimal) -> Decimal:
-		"""
-		Helper method to calculate the delta and update the cache in one go.
-		Returns: (New Size - Old Size)
-		"""
-		old_size = self.get_last_size(instrument_id, side, price)
-		delta = new_size - old_size
-		self.update_size(instrument_id, side, price, new_size)
-		return delta
-
-
 class PolymarketIml(ImlBase, PolymarketMessageHandler):
 	def __init__(self, ws: Optional[IPolymarketWebsocket] = None):
 		super().__init__()
@@ -92,14 +73,21 @@ class PolymarketIml(ImlBase, PolymarketMessageHandler):
 
 	def subscribe(self, instrument_id: str, consumer: MarketDataConsumer):
 		super().subscribe(instrument_id, consumer)
+		self.delta_cache.add_instrument(instrument_id)
 
 		self.ws.subscribe_to_market(instrument_id)
 	
 	def handle_order_book_summary_event(self, event: OrderBookSummaryEvent):
-		for bid in event.bids:
-			self.delta_cache.update_size(event.token_id, Side.BUY, Decimal(bid.price), Decimal(bid.size))
-		for ask in event.asks:
-			self.delta_cache.update_size(event.token_id, Side.SELL, Decimal(ask.price), Decimal(ask.size))
+		token_id = event.token_id
+		if token_id is None:
+			# A book without an asset cannot be routed to any instrument
+			return
+
+		# A snapshot supersedes every level seen before it, so each side is
+		# replaced wholesale; levels missing from the snapshot must not linger
+		reset_levels = self.delta_cache.reset_levels
+		reset_levels(token_id, Side.BUY, _to_tick_levels(event.bids))
+		reset_levels(token_id, Side.SELL, _to_tick_levels(event.asks))
 		
 		self.emit_message(
 			order_book_summary_event_to_market_event(
@@ -108,32 +96,49 @@ class PolymarketIml(ImlBase, PolymarketMessageHandler):
 		)
 
 	def handle_price_change_event(self, event: PriceChangeEvent):
-		get_delta = self.delta_cache.get_delta
+		get_sides = self.delta_cache.get_sides
 		timestamp_ms = _datetime_to_unix_ms(event.timestamp)
 
-		token_groups: dict[str, list[ImlLevelDelta]] = {}
+		token_groups: defaultdict[str, list[ImlLevelDelta]] = defaultdict(list)
 
-		for pc in event.price_changes:
-			t_id = pc.token_id
-			# Convert string side to enum
-			side = Side.BUY if pc.side == "BUY" else Side.SELL
+		price_changes = event.price_changes
+		if not price_changes:
+			return
 
-			delta = ImlLevelDelta(
-				price=Decimal(pc.price),
-				size_delta=get_delta(pc.token_id, side, Decimal(pc.price), Decimal(pc.size)),
-				side=side,
-			)
+		# Rows of a batch mostly share a token, so its cache maps are resolved
+		# once per run of rows and DeltaCache.get_delta is inlined below. Some
+		# replays deliver thousands of rows in one message.
+		last_t_id = price_changes[0].token_id
+		sides = get_sides(last_t_id)
 
-			if t_id not in token_groups:
-				token_groups[t_id] = [delta]
+		for pc in price_changes:
+			t_id = pc.token_id
+			if t_id != last_t_id:
+				sides = get_sides(t_id)
+				last_t_id = t_id
+			side = _SIDE_MAP[pc.side]
+			levels = sides[side]
+
+			# The cache tracks sizes exactly in ticks; the emitted delta is a float like the book.
+			# An emptied level is removed explicitly: the book sums float deltas, and
+			# those need not cancel out to exactly 0.
+			price = pc.price
+			price_ticks = round(price * _PRICE_SCALE)
+			size_ticks = round(pc.size * _SIZE_SCALE)
+			if size_ticks <= 0:
+				levels.pop(price_ticks, None)
+				size_delta = REMOVE_LEVEL
 			else:
-				token_groups[t_id].append(delta)
+				size_delta = (size_ticks - levels.get(price_ticks, 0)) / _SIZE_SCALE
+				levels[price_ticks] = size_ticks
+
+			token_groups[t_id].append(ImlLevelDelta(price, size_delta, side))
 
 		for token_id, deltas in token_groups.items():
 			self.emit_message(
 				ImlOrderBookUpdateEvent(
 					venue=Venue.POLYMARKET,
-					instrument_id=token_id,
+					instrument_id=sys.intern(token_id),
 					timestamp=timestamp_ms,
 					deltas=deltas
 				)
@@ -143,23 +148,25 @@ class PolymarketIml(ImlBase, PolymarketMessageHandler):
 		return
 
 	def handle_last_trade_price_event(self, event: LastTradePriceEvent):
-		# Convert string side to enum
-		side = Side.BUY if event.side == "BUY" else Side.SELL
+		side = _SIDE_MAP[event.side]
 		
-		self.delta_cache.update_size(event.token_id, side, Decimal(event.price), Decimal(event.size))
+		self.delta_cache.update_size(event.token_id, side, _price_ticks(event.price), _size_ticks(event.size))
 
 		self.emit_message(
 			ImlTradeEvent(
 				venue=Venue.POLYMARKET,
-				instrument_id=event.token_id,
+				instrument_id=sys.intern(event.token_id),
 				timestamp=_datetime_to_unix_ms(event.timestamp),
-				price=Decimal(event.price),
-				size=Decimal(event.size),
+				price=event.price,
+				size=event.size,
 				side=side,
 			)
 		)
 
 
+# datetime.timestamp() does the tz arithmetic in Python; events in a burst share
+# their timestamp, so equal datetimes are converted once
+@lru_cache(maxsize=1024)
 def _datetime_to_unix_ms(dt) -> int:
 	"""Convert datetime to Unix timestamp in milliseconds"""
 	if dt is None:
@@ -167,23 +174,40 @@ def _datetime_to_unix_ms(dt) -> int:
 	return int(dt.timestamp() * 1000)
 
 
+def _to_tick_levels(orders: list) -> Dict[int, int]:
+	"""Price ticks -> size ticks of a snapshot side, without empty levels"""
+	return {
+		price: size
+		for price, size in zip(
+			map(_price_ticks, map(_get_price, orders)),
+			map(_size_ticks, map(_get_size, orders)),
+		)
+		if size > 0
+	}
+
+
+def _to_levels(orders: list) -> list[ImlLevel]:
+	# map drives the attribute reads and the constructor calls from C, with no
+	# bytecode per level
+	return list(map(ImlLevel, map(_get_price, orders), map(_get_size, orders)))
+
+
 def order_book_summary_event_to_market_event(event: OrderBookSummaryEvent) -> ImlOrderBookSnapshotEvent:
+	"""
+	Raises:
+		ValueError: If the summary has no token id
+	"""
+	token_id = event.token_id
+	if token_id is None:
+		raise ValueError("Order book summary has no asset_id")
+
+	# The levels were validated when the frame was decoded and the IML messages
+	# are plain dataclasses, so this is a straight re-wrap. A snapshot can carry
+	# hundreds of levels, so they are built without a per-level comprehension.
 	return ImlOrderBookSnapshotEvent(
 		venue=Venue.POLYMARKET,
-		instrument_id=event.token_id,
+		instrument_id=sys.intern(token_id),
 		timestamp=_datetime_to_unix_ms(event.timestamp),
-		bids=[
-			ImlLevel(
-				price=Decimal(bid.price),
-				size=Decimal(bid.size),
-			)
-			for bid in event.bids
-		],
-		asks=[
-			ImlLevel(
-				price=Decimal(ask.price),
-				size=Decimal(ask.size),
-			)
-			for ask in event.asks
-		],
+		bids=_to_levels(event.bids),
+		asks=_to_levels(event.asks),
 	)
@@ -1,6 +1,9 @@
 import json
 
-from typing import Protocol
+from operator import attrgetter
+from typing import Callable, Protocol, Union
+
+from pydantic import TypeAdapter, ValidationError
 
 from polybot.connection.ws_connection_base import ConnectionBase
 
@@ -11,6 +14,7 @@ from .types.messages import (
 	PriceChangeEvent,
 	TickSizeChangeEvent,
 	LastTradePriceEvent,
+	MarketChannelEvent,
 )
 
 import logging
@@ -26,26 +30,48 @@ def build_market_url() -> str:
 	return POLYMARKET_SOCKET_URL + "/ws/" + MARKET_CHANNEL
 
 
+# Parses and validates a raw frame, a single event or a list of them, in one
+# pass without building intermediate dicts
+_MARKET_EVENTS_ADAPTER = TypeAdapter(Union[MarketChannelEvent, list[MarketChannelEvent]])
+
+# Event class -> getter for the handler method of that event
+_EVENT_HANDLERS: dict[type, Callable[[PolymarketMessageHandler], Callable]] = {
+	OrderBookSummaryEvent: attrgetter("handle_order_book_summary_event"),
+	PriceChangeEvent: attrgetter("handle_price_change_event"),
+	TickSizeChangeEvent: attrgetter("handle_tick_size_change_event"),
+	LastTradePriceEvent: attrgetter("handle_last_trade_price_event"),
+}
+
+# Raw event_type tag -> event class, for frames decoded as plain dicts
+_EVENT_TYPES: dict[str, type] = {
+	MessageType.BOOK.value: OrderBookSummaryEvent,
+	MessageType.PRICE_CHANGE.value: PriceChangeEvent,
+	MessageType.TICK_SIZE_CHANGE.value: TickSizeChangeEvent,
+	MessageType.LAST_TRADE_PRICE.value: LastTradePriceEvent,
+}
+
+
+def _decode_market_events(handler: PolymarketMessageHandler, message: Union[str, bytes]):
+	try:
+		events = _MARKET_EVENTS_ADAPTER.validate_json(message)
+	except ValidationError:
+		# Unknown event types and malformed events go through the per-event path,
+		# so the valid events of a frame are still handled before it raises
+		_process_market_events(handler, json.loads(message))
+		return
+
+	if isinstance(events, list):
+		for event in events:
+			_EVENT_HANDLERS[type(event)](handler)(event)
+	else:
+		_EVENT_HANDLERS[type(events)](handler)(events)
+
+
 def _process_market_event(handler: PolymarketMessageHandler, msg: dict):
-	match msg["event_type"]:
-		case MessageType.BOOK.value:
-			handler.handle_order_book_summary_event(
-				OrderBookSummaryEvent(**msg)
-			)
-		case MessageType.PRICE_CHANGE.value:
-			handler.handle_price_change_event(
-				PriceChangeEvent(**msg)
-			)
-		case MessageType.TICK_SIZE_CHANGE.value:
-			handler.handle_tick_size_change_event(
-				TickSizeChangeEvent(**msg)
-			)
-		case MessageType.LAST_TRADE_PRICE.value:
-			handler.handle_last_trade_price_event(
-				LastTradePriceEvent(**msg)
-			)
-		case _:
-			raise ValueError("Invalid event type")
+	event_cls = _EVENT_TYPES.get(msg["event_type"])
+	if event_cls is None:
+		raise ValueError("Invalid event type")
+	_EVENT_HANDLERS[event_cls](handler)(event_cls(**msg))
 
 
 def _process_market_events(handler: PolymarketMessageHandler, msg: dict | list):
@@ -76,10 +102,7 @@ class PolyMarketWebSocket(ConnectionBase, IPolymarketWebsocket):
 
 	def on_message(self, ws, message):
 		try:
-			_process_market_events(
-				self.handler,
-				json.loads(message),
-			)
+			_decode_market_events(self.handler, message)
 		except Exception:
 			logger.error(traceback.format_exc())
 
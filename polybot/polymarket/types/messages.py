@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional, Union
 
 from pydantic import BaseModel, Field, AliasChoices, field_serializer
 from enum import Enum
@@ -91,4 +91,11 @@ class TickSizeChangeEvent(TickSizeChange):
 
 class LastTradePriceEvent(LastTradePrice):
 	timestamp: datetime
-	event_type: Literal["last_trade_price"]
\ No newline at end of file
+	event_type: Literal["last_trade_price"]
+
+
+# Any event on the market channel, told apart by its event_type tag
+MarketChannelEvent = Annotated[
+	Union[OrderBookSummaryEvent, PriceChangeEvent, TickSizeChangeEvent, LastTradePriceEvent],
+	Field(discriminator="event_type"),
+]
@@ -1,19 +1,20 @@
 import time
 
-from typing import Protocol
+from typing import Protocol, Sequence
 
 from polybot.common.types import INSTRUMENT_ID, ORDER_ID, Order, OrderRequest, OrderStatus
 
 from .order_id_generator import generate_order_id
 
 
-ActiveOrderStatus = [OrderStatus.INFLIGHT, OrderStatus.ACTIVE, OrderStatus.INFLIGHT_CANCELLED]
+ActiveOrderStatus = frozenset((OrderStatus.INFLIGHT, OrderStatus.ACTIVE, OrderStatus.INFLIGHT_CANCELLED))
 
 
 class IOrderReader(Protocol):
-	def get_active_orders(self, iid: INSTRUMENT_ID) -> list[Order]:
+	def get_active_orders(self, iid: INSTRUMENT_ID) -> Sequence[Order]:
 		"""
 		Gets all active orders for a given instrument at a point in time.
+		The result may be shared between callers and must not be modified.
 
 		Orders are considered active if they are in any of the following states:
 		 - INFLIGHT
@@ -22,7 +23,7 @@ class IOrderReader(Protocol):
 		"""
 		...
 
-	def get_all_active_orders(self) -> list[Order]:
+	def get_all_active_orders(self) -> Sequence[Order]:
 		...
 
 
@@ -48,17 +49,36 @@ class IOrderManager(Protocol):
 	def order_cancelled(self, order_id: ORDER_ID):
 		...
 
+	def order_rejected(self, order_id: ORDER_ID):
+		...
+
 
 class OrderManager(IOrderManager, IOrderReader):
 	def __init__(self):
 		self.orders: dict[ORDER_ID, Order] = {}
 		self.exchange_order_ids: dict[str, ORDER_ID] = {}
+		# Indexes of the orders in an ActiveOrderStatus, kept in step with every
+		# status change so reads never scan historical orders. Dicts rather than
+		# sets so orders stay in placement order.
+		self._active: dict[ORDER_ID, Order] = {}
+		self._active_by_iid: dict[INSTRUMENT_ID, dict[ORDER_ID, Order]] = {}
+
+		# Active order reads are cached as tuples tagged with the version they were
+		# built at. Every change to the order set or an order status bumps the
+		# version after it is applied, so a stale entry is never reused.
+		self._version = 0
+		self._active_cache: dict[INSTRUMENT_ID, tuple[int, tuple[Order, ...]]] = {}
+		self._all_active_cache: tuple[int, tuple[Order, ...]] = (-1, ())
 
 
 	def add_order(self, order: OrderRequest) -> ORDER_ID:
 		order_id = generate_order_id()
 
-		self.orders[order_id] = Order(
+		# Order timestamps are ints, matching the declared field type
+		now = int(time.time())
+
+		# Validated on construction; pydantic-core is faster than model_construct here
+		record = Order(
 			order_id=order_id,
 			instrument_id=order.instrument_id,
 			side=order.side,
@@ -67,9 +87,13 @@ class OrderManager(IOrderManager, IOrderReader):
 			quantity=order.quantity,
 			status=OrderStatus.INFLIGHT,
 			filled_quantity=0,
-			created_at=time.time(),
-			updated_at=time.time(),
+			created_at=now,
+			updated_at=now,
 		)
+		self.orders[order_id] = record
+		self._active[order_id] = record
+		self._active_by_iid.setdefault(record.instrument_id, {})[order_id] = record
+		self._version += 1
 
 		return order_id
 
@@ -77,8 +101,8 @@ class OrderManager(IOrderManager, IOrderReader):
 		order = self.orders[order_id]
 		
 		order.exchange_order_id = exchange_order_id
-		order.status = OrderStatus.ACTIVE
-		order.updated_at = time.time()
+		order.updated_at = int(time.time())
+		self._set_status(order, OrderStatus.ACTIVE)
 
 		self.exchange_order_ids[exchange_order_id] = order_id
 
@@ -92,24 +116,62 @@ class OrderManager(IOrderManager, IOrderReader):
 		order = self.orders[order_id]
 		
 		order.filled_quantity += fill_quantity
-		order.updated_at = time.time()
+		order.updated_at = int(time.time())
 
 		if order.filled_quantity == order.quantity:
-			order.status = OrderStatus.FILLED
+			self._set_status(order, OrderStatus.FILLED)
 
 	def cancel_requested(self, order_id: ORDER_ID):
 		order = self.orders[order_id]
-		order.status = OrderStatus.INFLIGHT_CANCELLED
-		order.updated_at = time.time()
+		order.updated_at = int(time.time())
+		self._set_status(order, OrderStatus.INFLIGHT_CANCELLED)
 
 	def order_cancelled(self, order_id: ORDER_ID):
 		order = self.orders[order_id]
-		order.status = OrderStatus.CANCELLED
-		order.updated_at = time.time()
+		order.updated_at = int(time.time())
+		self._set_status(order, OrderStatus.CANCELLED)
 
-
-	def get_active_orders(self, iid: INSTRUMENT_ID) -> list[Order]:
-		return [order for order in self.orders.values() if order.instrument_id == iid and order.status in ActiveOrderStatus]
-
-	def get_all_active_orders(self) -> list[Order]:
-		return [order for order in self.orders.values() if order.status in ActiveOrderStatus]
+	def order_rejected(self, order_id: ORDER_ID):
+		order = self.orders[order_id]
+		order.updated_at = int(time.time())
+		self._set_status(order, OrderStatus.REJECTED)
+
+	def _set_status(self, order: Order, status: OrderStatus):
+		"""Move an order to status, keeping the active indexes and the read version in step"""
+		order.status = status
+
+		order_id = order.order_id
+		if status in ActiveOrderStatus:
+			self._active[order_id] = order
+			self._active_by_iid.setdefault(order.instrument_id, {})[order_id] = order
+		else:
+			self._active.pop(order_id, None)
+			by_iid = self._active_by_iid.get(order.instrument_id)
+			if by_iid is not None:
+				by_iid.pop(order_id, None)
+
+		self._version += 1
+
+
+	# The version is read before the active index is copied, so a change made
+	# while a read is building can at worst make the next read rebuild.
+	def get_active_orders(self, iid: INSTRUMENT_ID) -> Sequence[Order]:
+		version = self._version
+		cached = self._active_cache.get(iid)
+		if cached is not None and cached[0] == version:
+			return cached[1]
+
+		orders = self._active_by_iid.get(iid)
+		active = tuple(orders.values()) if orders else ()
+		self._active_cache[iid] = (version, active)
+		return active
+
+	def get_all_active_orders(self) -> Sequence[Order]:
+		version = self._version
+		cached_version, active = self._all_active_cache
+		if cached_version == version:
+			return active
+
+		active = tuple(self._active.values())
+		self._all_active_cache = (version, active)
+		return active
@@ -4,7 +4,8 @@ from typing import Protocol
 
 from polybot.common.types import INSTRUMENT_ID
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
 	iid: INSTRUMENT_ID
 	volume: float
@@ -31,16 +32,26 @@ class IPositionReader(Protocol):
 class PositionManager(IPositionWriter, IPositionReader):
 	def __init__(self):
 		self.positions: dict[INSTRUMENT_ID, dict[float, Position]] = defaultdict(dict)
+
+		# Running totals per instrument, updated by add_position so reads are a
+		# single lookup. add_position is the only writer.
+		self._volume_totals: dict[INSTRUMENT_ID, float] = {}
+		self._nominal_totals: dict[INSTRUMENT_ID, float] = {}
 	
 	def get_total_volume(self, iid: INSTRUMENT_ID) -> float:
-		return sum(position.volume for position in self.positions[iid].values())
+		return self._volume_totals.get(iid, 0.0)
 
 	def add_position(self, iid: INSTRUMENT_ID, volume: float, price: float):
-		if price in self.positions[iid]:
-			self.positions[iid][price].volume += volume
+		positions = self.positions[iid]
+		position = positions.get(price)
+		if position is not None:
+			position.volume += volume
 		else:
-			self.positions[iid][price] = Position(iid, volume, price)
+			positions[price] = Position(iid, volume, price)
 
-	def get_total_nominal_value(self, iid: INSTRUMENT_ID) -> float:
-		return sum(position.get_nominal_value() for position in self.positions[iid].values())
+		volume_totals, nominal_totals = self._volume_totals, self._nominal_totals
+		volume_totals[iid] = volume_totals.get(iid, 0.0) + volume
+		nominal_totals[iid] = nominal_totals.get(iid, 0.0) + volume * price
 
+	def get_total_nominal_value(self, iid: INSTRUMENT_ID) -> float:
+		return self._nominal_totals.get(iid, 0.0)
@@ -56,22 +56,21 @@ class StrategyRegistry:
 			strategy = create_strategy(entry.to_strategy_config())
 	"""
 	
-	_instance: "StrategyRegistry | None" = None
-	
 	def __init__(self):
 		self._entries: dict[str, RegistrationEntry] = {}
 	
 	@classmethod
 	def get_instance(cls) -> "StrategyRegistry":
 		"""Get the singleton registry instance."""
-		if cls._instance is None:
-			cls._instance = cls()
-		return cls._instance
+		return _REGISTRY
 	
 	@classmethod
 	def reset(cls) -> None:
-		"""Reset the registry. Useful for testing."""
-		cls._instance = None
+		"""
+		Reset the registry. Useful for testing.
+		Clears the singleton in place, so references to it stay valid.
+		"""
+		_REGISTRY._entries.clear()
 	
 	def register(self, entry: RegistrationEntry) -> None:
 		"""
@@ -87,6 +86,16 @@ class StrategyRegistry:
 			)
 		self._entries[entry.name] = entry
 	
+	def unregister(self, name: str) -> None:
+		"""
+		Remove a registered strategy entry.
+		
+		Raises:
+			ValueError: If no strategy with this name is registered.
+		"""
+		if self._entries.pop(name, None) is None:
+			raise ValueError(f"Strategy '{name}' is not registered.")
+	
 	def get_all(self) -> list[RegistrationEntry]:
 		"""Get all registered strategies."""
 		return list(self._entries.values())
@@ -97,3 +106,6 @@ class StrategyRegistry:
 	def __iter__(self):
 		return iter(self._entries.values())
 
+
+# Created at import so get_instance never has to check for it
+_REGISTRY = StrategyRegistry()
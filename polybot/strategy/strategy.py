@@ -1,5 +1,4 @@
-from typing import Protocol, Union
-from decimal import Decimal
+from typing import Protocol
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -13,11 +12,11 @@ from .config import StrategyConfig
 
 from polybot.common.types import INSTRUMENT_ID, OrderRequest
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeData:
 	instrument_id: INSTRUMENT_ID
-	price: Union[float, Decimal]
-	size: Union[float, Decimal]
+	price: float
+	size: float
 	side: Side
 
 class StrategyInterface(Protocol):
@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
 
-class Credentials(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Credentials:
 	...
 
 
+@dataclass(frozen=True, slots=True)
 class PolymarketCredentials(Credentials):
 	wallet_private_key: str
 	wallet_address: str
@@ -1,7 +1,10 @@
-from .strategy_wrapper import StrategyWrapper
-from .registry import convert_sdk_limit_to_core_limit
+from .strategy_wrapper import StrategyWrapper, make_wrapper_class
+from .registry import convert_sdk_limit_to_core_limit, register_sdk_strategy, validate_registration_inputs
 
 __all__ = [
 	"StrategyWrapper",
+	"make_wrapper_class",
 	"convert_sdk_limit_to_core_limit",
+	"register_sdk_strategy",
+	"validate_registration_inputs",
 ]
@@ -5,9 +5,89 @@ This module provides conversion functions for translating SDK types
 to core types when registering strategies.
 """
 
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
+from typing import Sequence, Type
+
 from polybot.limits import Limit
+from polybot.strategy import StrategyRegistry, RegistrationEntry
+from sdk.base_strategy import Strategy
 from sdk.types import InstrumentLimit
 
+from .strategy_wrapper import make_wrapper_class
+
+_get_instrument_id = attrgetter("instrument_id")
+
+
+def register_sdk_strategy(
+	strat_class: Type[Strategy],
+	instrument_ids: Sequence[str],
+	limits: Sequence[InstrumentLimit],
+	name: str,
+	registry: StrategyRegistry,
+) -> RegistrationEntry:
+	"""
+	Validate, wrap and register an SDK strategy with a core registry.
+
+	Shared by Polybot.register_strategy and the module level register_strategy.
+
+	Returns:
+		The RegistrationEntry that was created and registered.
+
+	Raises:
+		ValueError: If a strategy with the same name is already registered.
+		ValueError: If instrument_ids is empty.
+		ValueError: If limits don't cover all instrument_ids.
+	"""
+	# Copied once; validation and the registration entry share the tuple
+	instrument_ids = tuple(instrument_ids)
+
+	# Validate inputs
+	validate_registration_inputs(instrument_ids, limits)
+
+	# Use class name as default strategy name
+	strategy_name = name or strat_class.__name__
+
+	# Create the registration entry. The wrapper subclass adapting the SDK
+	# strategy to the core interface is built once per (class, name).
+	entry = RegistrationEntry(
+		name=strategy_name,
+		wrapper_cls=make_wrapper_class(strat_class, strategy_name),
+		instrument_ids=instrument_ids,
+		limits=tuple(map(convert_sdk_limit_to_core_limit, limits)),
+	)
+
+	registry.register(entry)
+
+	return entry
+
+
+def validate_registration_inputs(instrument_ids: Sequence[str], limits: Sequence[InstrumentLimit]) -> None:
+	"""
+	Validate the instruments and limits a strategy is registered with.
+
+	Raises:
+		ValueError: If instrument_ids is empty.
+		ValueError: If limits don't cover all instrument_ids.
+	"""
+	if not instrument_ids:
+		raise ValueError("instrument_ids cannot be empty")
+
+	# Validate that all instruments have limits defined. Most strategies trade
+	# one instrument, which is a scan of the limits rather than two sets.
+	if len(instrument_ids) == 1:
+		instrument_id = instrument_ids[0]
+		missing_limits = frozenset() if instrument_id in map(_get_instrument_id, limits) else frozenset(instrument_ids)
+	else:
+		missing_limits = frozenset(instrument_ids).difference(map(_get_instrument_id, limits))
+
+	if missing_limits:
+		raise ValueError(
+			f"Missing limits for instruments: {set(missing_limits)}. "
+			"Each instrument_id must have a corresponding limit."
+		)
+
 
 def convert_sdk_limit_to_core_limit(sdk_limit: InstrumentLimit) -> Limit:
 	"""
@@ -16,14 +96,28 @@ def convert_sdk_limit_to_core_limit(sdk_limit: InstrumentLimit) -> Limit:
 	The SDK exposes bid/ask limits separately, while the core uses
 	combined max values. We take the maximum of bid/ask for position limits.
 	"""
+	# InstrumentLimit is not hashable, so its fields form the cache key
+	return _convert_limit_fields(
+		sdk_limit.instrument_id,
+		sdk_limit.max_position_bid,
+		sdk_limit.max_position_ask,
+		sdk_limit.max_nominal_position_bid,
+		sdk_limit.max_nominal_position_ask,
+	)
+
+
+# Re-registering the same limits (tests, reloads) reuses the validated Limit,
+# which is safe to share because Limit is frozen
+@lru_cache(maxsize=1024)
+def _convert_limit_fields(
+	instrument_id: str,
+	max_position_bid: Decimal,
+	max_position_ask: Decimal,
+	max_nominal_position_bid: Decimal,
+	max_nominal_position_ask: Decimal,
+) -> Limit:
 	return Limit(
-		instrument_id=sdk_limit.instrument_id,
-		max_position_size=float(max(
-			sdk_limit.max_position_bid,
-			sdk_limit.max_position_ask
-		)),
-		max_nominal_position_size=float(max(
-			sdk_limit.max_nominal_position_bid,
-			sdk_limit.max_nominal_position_ask
-		)),
+		instrument_id=instrument_id,
+		max_position_size=float(max(max_position_bid, max_position_ask)),
+		max_nominal_position_size=float(max(max_nominal_position_bid, max_nominal_position_ask)),
 	)
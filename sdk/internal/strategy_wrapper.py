@@ -2,20 +2,43 @@ from polybot.strategy import StrategyBase, TradeData as CoreTradeData
 from polybot.common.types import OrderRequest as CoreOrder, INSTRUMENT_ID
 from polybot.common.orderbook import OrderBook
 from polybot.common.context_provider import ContextProvider
-from polybot.common.enums import OrderType
+from polybot.common.enums import OrderType, Side as CoreSide
 
 from sdk.base_strategy import Strategy
 from sdk.types import Order as SDKOrder, TradeData as SDKTradeData
 from sdk.enums import Side as SDKSide
 
+from functools import lru_cache
 from typing import Type
 
+# Orders returned by SDK strategies are checked once, on conversion, and the
+# core orders are built with the regular pydantic constructor. model_construct
+# runs in Python and measured about twice as slow as pydantic-core validation
+# for these small models, so it is not used here. Limits are converted once at
+# registration.
+
+_SDK_TO_CORE_SIDE: dict[SDKSide, CoreSide] = {
+	SDKSide.BUY: CoreSide.BUY,
+	SDKSide.SELL: CoreSide.SELL,
+}
+# Returned for every callback that emits no orders, the common case, so a
+# no-op tick allocates nothing. Callers only iterate the result and must not
+# mutate it.
+_NO_ORDERS: list[CoreOrder] = []
+
+_CORE_TO_SDK_SIDE: dict[CoreSide, SDKSide] = {core: sdk for sdk, core in _SDK_TO_CORE_SIDE.items()}
+
 
 class StrategyWrapper(StrategyBase):
 	def __init__(self, strat_cls: Type[Strategy]):
 		super().__init__()
 		self._internal = strat_cls()
 
+		# Callbacks left as the base no-ops never emit orders, so the events
+		# are not converted for them at all
+		self._has_on_trade = _overrides_on_trade(strat_cls)
+		self._has_on_order_book_change = _overrides_on_order_book_change(strat_cls)
+
 	def on_trade(
 		self,
 		instrument_id: INSTRUMENT_ID,
@@ -23,18 +46,21 @@ class StrategyWrapper(StrategyBase):
 		orderbook: OrderBook,
 		context: ContextProvider,
 	) -> list[CoreOrder]:
+		if not self._has_on_trade:
+			return _NO_ORDERS
+
+		# SDK strategies see string ids; venue ids usually already are
+		iid = instrument_id if type(instrument_id) is str else str(instrument_id)
+
 		# Convert core trade data to SDK trade data
 		sdk_trade = SDKTradeData(
-			instrument_id=str(instrument_id),
-			price=trade_data.price,
-			size=trade_data.size,
-			side=SDKSide(trade_data.side.value),
+			iid,
+			trade_data.price,
+			trade_data.size,
+			_CORE_TO_SDK_SIDE[trade_data.side],
 		)
 		
-		return [
-			_convert_sdk_order_to_core_order(order)
-			for order in self._internal.on_trade(str(instrument_id), sdk_trade, orderbook)
-		]
+		return _convert_sdk_orders(self._internal.on_trade(iid, sdk_trade, orderbook))
 
 	def on_order_book_change(
 		self,
@@ -42,20 +68,79 @@ class StrategyWrapper(StrategyBase):
 		orderbook: OrderBook,
 		context: ContextProvider,
 	) -> list[CoreOrder]:
-		return [
-			_convert_sdk_order_to_core_order(order)
-			for order in self._internal.on_order_book_change(str(instrument_id), orderbook)
-		]
+		if not self._has_on_order_book_change:
+			return _NO_ORDERS
+
+		iid = instrument_id if type(instrument_id) is str else str(instrument_id)
+		return _convert_sdk_orders(self._internal.on_order_book_change(iid, orderbook))
 		
 
-def _convert_sdk_order_to_core_order(order: SDKOrder) -> CoreOrder:
-	"""Convert an SDK Order to a Core Order"""
-	from polybot.common.enums import Side as CoreSide
-	
-	return CoreOrder(
-		instrument_id=order.instrument_id,
-		side=CoreSide(order.side.value),
-		order_type=OrderType.LIMIT,
-		price=float(order.price),
-		quantity=float(order.volume),
-	)
+@lru_cache(maxsize=None)
+def make_wrapper_class(strat_cls: Type[Strategy], name: str) -> Type[StrategyWrapper]:
+	"""
+	The StrategyWrapper subclass bound to strat_cls, named after the strategy.
+
+	Cached per (strategy class, name), so registering the same strategy again
+	reuses the class instead of building a new one.
+	"""
+	class BoundStrategyWrapper(StrategyWrapper):
+		_bound_strategy_class = strat_cls
+		_has_on_trade = _overrides_on_trade(strat_cls)
+		_has_on_order_book_change = _overrides_on_order_book_change(strat_cls)
+
+		# Everything StrategyWrapper.__init__ derives from strat_cls is settled
+		# above, once per class, so instances skip it and the super() proxy
+		def __init__(self, _strat_cls: Type[Strategy] = strat_cls):
+			StrategyBase.__init__(self)
+			self._internal = _strat_cls()
+
+	# Give it a meaningful name for debugging
+	BoundStrategyWrapper.__name__ = f"{name}Wrapper"
+	BoundStrategyWrapper.__qualname__ = f"{name}Wrapper"
+
+	return BoundStrategyWrapper
+
+
+def _overrides_on_trade(strat_cls: Type[Strategy]) -> bool:
+	return strat_cls.on_trade is not Strategy.on_trade
+
+
+def _overrides_on_order_book_change(strat_cls: Type[Strategy]) -> bool:
+	return strat_cls.on_order_book_change is not Strategy.on_order_book_change
+
+
+def _convert_sdk_orders(orders: list[SDKOrder]) -> list[CoreOrder]:
+	"""
+	Convert every order a strategy callback returned.
+
+	This is where SDK orders are checked; every field is converted to its
+	core type here. The lookups are bound to locals once per batch instead of
+	once per order.
+
+	Raises:
+		ValueError: If the side is not an SDK Side, or the price or the volume
+			is not greater than 0
+	"""
+	if not orders:
+		return _NO_ORDERS
+
+	to_core_side = _SDK_TO_CORE_SIDE.get
+	construct = CoreOrder
+	limit = OrderType.LIMIT
+
+	core_orders = []
+	for instrument_id, side, price, volume in orders:
+		if not (price > 0 and volume > 0):
+			raise ValueError(f"Order price and volume must be greater than 0, got price={price} volume={volume}")
+		core_side = to_core_side(side)
+		if core_side is None:
+			raise ValueError(f"Invalid order side: {side!r}")
+		core_orders.append(construct(
+			instrument_id=instrument_id,
+			side=core_side,
+			order_type=limit,
+			# Floats, the common case, need no conversion
+			price=price if type(price) is float else float(price),
+			quantity=volume if type(volume) is float else float(volume),
+		))
+	return core_orders
@@ -25,8 +25,7 @@ from typing import Type, Optional
 from sdk.credentials import Credentials
 from sdk.base_strategy import Strategy
 from sdk.types import InstrumentLimit
-from sdk.internal.strategy_wrapper import StrategyWrapper
-from sdk.internal.registry import convert_sdk_limit_to_core_limit
+from sdk.internal.registry import register_sdk_strategy
 
 # Import from core
 from polybot.app import App, AppBuilder, AppInterface, AppDependencies
@@ -53,6 +52,7 @@ class Polybot:
         polybot.register_strategy(MyStrategy, ["0x123..."], [limits])
         polybot.start()
     """
+    __slots__ = ("_app", "_registry", "_credentials")
     
     def __init__(
         self,
@@ -111,67 +111,7 @@ class Polybot:
             ValueError: If instrument_ids is empty.
             ValueError: If limits don't cover all instrument_ids.
         """
-        # Validate inputs
-        if not instrument_ids:
-            raise ValueError("instrument_ids cannot be empty")
-        
-        # Validate that all instruments have limits defined
-        limit_instrument_ids = {limit.instrument_id for limit in limits}
-        missing_limits = set(instrument_ids) - limit_instrument_ids
-        if missing_limits:
-            raise ValueError(
-                f"Missing limits for instruments: {missing_limits}. "
-                "Each instrument_id must have a corresponding limit."
-            )
-        
-        # Use class name as default strategy name
-        strategy_name = name or strat_class.__name__
-        
-        # Create the wrapper class that adapts SDK strategy to core interface
-        wrapper_cls = self._create_wrapper_class(strat_class, strategy_name)
-        
-        # Convert SDK limits to core limits
-        core_limits = tuple(
-            convert_sdk_limit_to_core_limit(limit)
-            for limit in limits
-        )
-        
-        # Create the registration entry
-        entry = RegistrationEntry(
-            name=strategy_name,
-            wrapper_cls=wrapper_cls,
-            instrument_ids=tuple(instrument_ids),
-            limits=core_limits,
-        )
-        
-        # Register with the registry
-        self._registry.register(entry)
-        
-        return entry
-    
-    def _create_wrapper_class(
-        self,
-        strat_class: Type[Strategy],
-        name: str
-    ) -> Type[StrategyWrapper]:
-        """
-        Create a wrapper class for the given strategy.
-        
-        We create a new class for each registration to maintain proper
-        class identity and allow for strategy-specific customization.
-        """
-        # Create a new wrapper class bound to this specific strategy class
-        class BoundStrategyWrapper(StrategyWrapper):
-            _bound_strategy_class = strat_class
-            
-            def __init__(self):
-                super().__init__(self._bound_strategy_class)
-        
-        # Give it a meaningful name for debugging
-        BoundStrategyWrapper.__name__ = f"{name}Wrapper"
-        BoundStrategyWrapper.__qualname__ = f"{name}Wrapper"
-        
-        return BoundStrategyWrapper
+        return register_sdk_strategy(strat_class, instrument_ids, limits, name, self._registry)
     
     def start(self) -> None:
         """
@@ -217,6 +157,7 @@ class PolybotBuilder:
             .with_eml(mock_eml) \\
             .build()
     """
+    __slots__ = ("_credentials", "_app", "_registry", "_ids", "_iml", "_eml")
     
     def __init__(self):
         """Initialize builder with no components set."""
@@ -35,12 +35,14 @@ from typing import Optional, Type
 
 from .base_strategy import Strategy
 from .types import InstrumentLimit
-from .internal.strategy_wrapper import StrategyWrapper
-from .internal.registry import convert_sdk_limit_to_core_limit
+from .internal.registry import register_sdk_strategy
 
 # Import from core - SDK depends on core, not the other way around
 from polybot.strategy import StrategyRegistry, RegistrationEntry
 
+# Bound once; most registrations go to the global singleton
+_default_registry_factory = StrategyRegistry.get_instance
+
 
 def register_strategy(
 	strat_class: Type[Strategy],
@@ -91,65 +93,6 @@ def register_strategy(
 			registry=test_registry,
 		)
 	"""
-	# Validate inputs
-	if not instrument_ids:
-		raise ValueError("instrument_ids cannot be empty")
-	
-	# Validate that all instruments have limits defined
-	limit_instrument_ids = {limit.instrument_id for limit in limits}
-	missing_limits = set(instrument_ids) - limit_instrument_ids
-	if missing_limits:
-		raise ValueError(
-			f"Missing limits for instruments: {missing_limits}. "
-			"Each instrument_id must have a corresponding limit."
-		)
-	
-	# Use class name as default strategy name
-	strategy_name = name or strat_class.__name__
-	
-	# Create the wrapper class that adapts SDK strategy to core interface
-	wrapper_cls = _create_wrapper_class(strat_class, strategy_name)
-	
-	# Convert SDK limits to core limits
-	core_limits = tuple(
-		convert_sdk_limit_to_core_limit(limit)
-		for limit in limits
-	)
-	
-	# Create the registration entry
-	entry = RegistrationEntry(
-		name=strategy_name,
-		wrapper_cls=wrapper_cls,
-		instrument_ids=tuple(instrument_ids),
-		limits=core_limits,
-	)
-	
 	# Register with the provided registry or the global singleton
-	target_registry = registry or StrategyRegistry.get_instance()
-	target_registry.register(entry)
-	
-	return entry
-
-
-def _create_wrapper_class(
-	strat_class: Type[Strategy],
-	name: str
-) -> Type[StrategyWrapper]:
-	"""
-	Create a wrapper class for the given strategy.
-	
-	We create a new class for each registration to maintain proper
-	class identity and allow for strategy-specific customization.
-	"""
-	# Create a new wrapper class bound to this specific strategy class
-	class BoundStrategyWrapper(StrategyWrapper):
-		_bound_strategy_class = strat_class
-		
-		def __init__(self):
-			super().__init__(self._bound_strategy_class)
-	
-	# Give it a meaningful name for debugging
-	BoundStrategyWrapper.__name__ = f"{name}Wrapper"
-	BoundStrategyWrapper.__qualname__ = f"{name}Wrapper"
-	
-	return BoundStrategyWrapper
+	target_registry = registry if registry is not None else _default_registry_factory()
+	return register_sdk_strategy(strat_class, instrument_ids, limits, name, target_registry)
@@ -1,6 +1,5 @@
-from dataclasses import dataclass
-from decimal import Decimal
-from pydantic import BaseModel
+from typing import NamedTuple
+from pydantic import BaseModel, ConfigDict
 from pydantic import condecimal
 
 from .enums import Side
@@ -9,8 +8,7 @@ from .enums import Side
 from polybot.common.orderbook import OrderBook
 
 
-@dataclass(frozen=True)
-class TradeData:
+class TradeData(NamedTuple):
 	"""
 	Information about a trade that occurred on the exchange.
 	
@@ -21,25 +19,30 @@ class TradeData:
 		side: The side of the taker (BUY or SELL)
 	"""
 	instrument_id: str
-	price: Decimal
-	size: Decimal
+	price: float
+	size: float
 	side: Side
 
 
-class Order(BaseModel):
+class Order(NamedTuple):
 	"""
 	An order is a request to buy or sell a specific instrument at a specific price.
 
 	As of current, ONLY LIMIT ORDERS ARE SUPPORTED.
 	The rationale is that with a market order, you do not know the price at which the order will be executed.
+
+	Orders are plain tuples so strategies can build many of them cheaply. Price
+	and volume are checked when the order is submitted: an order returned with
+	either <= 0 raises ValueError. Prices and volumes are floats, like the rest
+	of the engine; Decimal and int values are accepted and converted once.
 	"""
 	instrument_id: str # The instrument for which the order is being placed for
 	
 	side: Side # Is this a buy or a sell order
 
-	price: condecimal(gt=0) # The maximum price at which the order will be executed. Must be greater than 0.
+	price: float # The maximum price at which the order will be executed. Must be greater than 0.
 
-	volume: condecimal(gt=0) # The number of units of the instrument to be traded. Must be greater than 0.
+	volume: float # The number of units of the instrument to be traded. Must be greater than 0.
 
 	
 
@@ -53,6 +56,10 @@ class InstrumentLimit(BaseModel):
 	
 	Before placing an order, we validate that no limit is violated.
 	"""
+	# Limits are only validated at registration, so the schema is built on
+	# first use rather than when the SDK is imported
+	model_config = ConfigDict(defer_build=True)
+
 	instrument_id: str # The instrument for which the order is being placed
 
 	max_position_bid: condecimal(gt=0) # The maximum number of units that can be held on the bid side. Must be greater than 0.
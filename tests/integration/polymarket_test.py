@@ -5,20 +5,23 @@ These tests verify the complete data flow from exchange messages through to
 strategy order generation. They use mock components to simulate the exchange
 and capture outgoing orders.
 """
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from functools import cache
+from typing import Iterable, Iterator, Optional
 
 import pytest
 
 from polybot.app import App, AppBuilder, AppDependencies
+from polybot.channel import Channel
 from polybot.common.context_provider import ContextBuilder
 from polybot.common.enums import Venue, Side as CoreSide
 from polybot.common.types import OrderRequest, INSTRUMENT_ID, ORDER_ID
 from polybot.eml import ExecLink
 from polybot.ids.interface import IInstrumentDefintionStore
 from polybot.limits.limit_store import ILimitStore
-from polybot.limits.limit import Limit
+from polybot.limits.limit import Limit, LimitCheckResult
 from polybot.polymarket import PolymarketIml
 from polybot.polymarket.interfaces import PolymarketMessageHandler
 from polybot.polymarket.polymarket_ws import IPolymarketWebsocket
@@ -26,9 +29,11 @@ from polybot.polymarket.types.messages import (
     OrderBookSummaryEvent,
     LastTradePriceEvent,
     OrderSummary,
+    PriceChange,
+    PriceChangeEvent,
 )
 from polybot.state import OrderManager, PositionManager
-from polybot.strategy import StrategyRegistry
+from polybot.strategy import StrategyRegistry, RegistrationEntry
 
 from sdk.base_strategy import Strategy
 from sdk.registration import register_strategy
@@ -40,6 +45,26 @@ from sdk.enums import Side
 # Mock Components
 # -----------------------------------------------------------------------------
 
+# Default timestamp of injected messages. Nothing downstream orders events by
+# time, so tests never need to read the clock.
+_FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class _NullHandler:
+    """Stands in for the handler until set_handler is called, failing on any message"""
+    
+    def _fail(self, event):
+        raise RuntimeError("Handler not set. Call set_handler first.")
+    
+    handle_order_book_summary_event = _fail
+    handle_price_change_event = _fail
+    handle_tick_size_change_event = _fail
+    handle_last_trade_price_event = _fail
+
+
+_NULL_HANDLER = _NullHandler()
+
+
 class MockPolymarketWebsocket(IPolymarketWebsocket):
     """
     A mock websocket that allows injection of messages into the IML.
@@ -49,7 +74,7 @@ class MockPolymarketWebsocket(IPolymarketWebsocket):
     """
     
     def __init__(self):
-        self._handler: Optional[PolymarketMessageHandler] = None
+        self._handler: PolymarketMessageHandler = _NULL_HANDLER
         self._subscribed_markets: set[str] = set()
     
     def set_handler(self, handler: PolymarketMessageHandler):
@@ -79,20 +104,54 @@ class MockPolymarketWebsocket(IPolymarketWebsocket):
             token_id: The token/instrument ID
             bids: List of (price, size) tuples for bid levels
             asks: List of (price, size) tuples for ask levels
-            timestamp: Optional timestamp, defaults to now
+            timestamp: Optional timestamp, defaults to the frozen test time
         """
-        if self._handler is None:
-            raise RuntimeError("Handler not set. Call set_handler first.")
-        
         event = OrderBookSummaryEvent(
             event_type="book",
             asset_id=token_id,
-            timestamp=timestamp or datetime.now(timezone.utc),
+            timestamp=timestamp or _FROZEN_NOW,
             bids=[OrderSummary(price=p, size=s) for p, s in bids],
             asks=[OrderSummary(price=p, size=s) for p, s in asks],
         )
         self._handler.handle_order_book_summary_event(event)
     
+    def inject_price_change(
+        self,
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,  # "BUY" or "SELL"
+        condition_id: str = "0x" + "0" * 64,
+        timestamp: Optional[datetime] = None,
+    ):
+        """
+        Inject a price change message setting one level to a new absolute size.
+        
+        Args:
+            token_id: The token/instrument ID
+            price: Price of the level
+            size: New size of the level, 0 when it is emptied
+            side: "BUY" or "SELL" - the side of the level
+            condition_id: Market condition ID (can use default for testing)
+            timestamp: Optional timestamp, defaults to the frozen test time
+        """
+        change = PriceChange(
+            price=price,
+            size=size,
+            side=side,
+            asset_id=token_id,
+            best_bid=price,
+            best_ask=price,
+            hash="0x0",
+        )
+        event = PriceChangeEvent(
+            event_type="price_change",
+            market=condition_id,
+            timestamp=timestamp or _FROZEN_NOW,
+            price_changes=[change],
+        )
+        self._handler.handle_price_change_event(event)
+    
     def inject_trade(
         self,
         token_id: str,
@@ -113,12 +172,44 @@ class MockPolymarketWebsocket(IPolymarketWebsocket):
             side: "BUY" or "SELL" - the taker side
             condition_id: Market condition ID (can use default for testing)
             fee_rate_bps: Fee rate in basis points
-            timestamp: Optional timestamp, defaults to now
+            timestamp: Optional timestamp, defaults to the frozen test time
         """
-        if self._handler is None:
-            raise RuntimeError("Handler not set. Call set_handler first.")
+        self.inject_trades(token_id, [(price, size, side)], condition_id, fee_rate_bps, timestamp)
+    
+    def inject_trades(
+        self,
+        token_id: str,
+        trades: list[tuple[float, float, str]],
+        condition_id: str = "0x" + "0" * 64,
+        fee_rate_bps: float = 0.0,
+        timestamp: Optional[datetime] = None,
+    ):
+        """
+        Inject several trade messages for one token in a single call.
         
-        event = LastTradePriceEvent(
+        Args:
+            token_id: The token/instrument ID
+            trades: List of (price, size, side) tuples, side being the taker side
+            condition_id: Market condition ID (can use default for testing)
+            fee_rate_bps: Fee rate in basis points
+            timestamp: Optional timestamp shared by every trade, defaults to the frozen test time
+        """
+        timestamp = timestamp or _FROZEN_NOW
+        handle_event = self._handler.handle_last_trade_price_event
+        for price, size, side in trades:
+            handle_event(self._trade_event(token_id, price, size, side, condition_id, fee_rate_bps, timestamp))
+    
+    @staticmethod
+    def _trade_event(
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,
+        condition_id: str,
+        fee_rate_bps: float,
+        timestamp: datetime,
+    ) -> LastTradePriceEvent:
+        return LastTradePriceEvent(
             event_type="last_trade_price",
             asset_id=token_id,
             price=price,
@@ -126,33 +217,34 @@ class MockPolymarketWebsocket(IPolymarketWebsocket):
             side=side,
             market=condition_id,
             fee_rate_bps=fee_rate_bps,
-            timestamp=timestamp or datetime.now(timezone.utc),
+            timestamp=timestamp,
         )
-        self._handler.handle_last_trade_price_event(event)
 
 
 class MockInstrumentDefinitionStore(IInstrumentDefintionStore):
     """Simple mock that returns instrument IDs as-is"""
-    
     def __init__(self):
         self._instruments: dict[str, INSTRUMENT_ID] = {}
+        # Instrument -> (venue, exchange id) of its first registration
+        self._reverse: dict[INSTRUMENT_ID, tuple[Venue, str]] = {}
     
     def register_instrument(self, venue: Venue, exchange_id: str, instrument_id: INSTRUMENT_ID):
         """Register an instrument mapping"""
         self._instruments[f"{venue.value}:{exchange_id}"] = instrument_id
+        self._reverse.setdefault(instrument_id, (venue, exchange_id))
     
     def get_instrument_id(self, venue: Venue, exchange_id: str) -> INSTRUMENT_ID:
         return self._instruments.get(f"{venue.value}:{exchange_id}", exchange_id)
     
     def get_exchange_id(self, venue: Venue, instrument_id: INSTRUMENT_ID) -> str:
-        for key, iid in self._instruments.items():
-            if iid == instrument_id:
-                return key.split(":")[1]
-        return str(instrument_id)
+        mapping = self._reverse.get(instrument_id)
+        return mapping[1] if mapping is not None else str(instrument_id)
 
 
 class MockLimitStore(ILimitStore):
     """Simple mock limit store that allows all orders"""
+    # LimitCheckResult is frozen, so every check can share one
+    _ALLOW = LimitCheckResult(allowed=True)
     
     def __init__(self):
         self._limits: dict[INSTRUMENT_ID, Limit] = {}
@@ -160,9 +252,11 @@ class MockLimitStore(ILimitStore):
     def set_limit(self, instrument_id: INSTRUMENT_ID, limit: Limit):
         self._limits[instrument_id] = limit
     
+    def set_limits(self, items: Iterable[tuple[INSTRUMENT_ID, Limit]]):
+        self._limits.update(items)
+    
     def try_reserve_capacity(self, instrument_id: INSTRUMENT_ID, side: CoreSide, volume: float, price: float):
-        from polybot.limits.limit import LimitCheckResult
-        return LimitCheckResult(allowed=True)
+        return self._ALLOW
     
     def release_reserved_capacity(self, instrument_id: INSTRUMENT_ID, side: CoreSide, volume: float, price: float):
         pass
@@ -179,7 +273,6 @@ class MockExecLink(ExecLink):
     
     This allows tests to verify what orders would have been sent to the exchange.
     """
-    
     def __init__(self):
         self.orders: list[OrderRequest] = []
         self._order_counter = 0
@@ -194,13 +287,22 @@ class MockExecLink(ExecLink):
         """Mock cancel - no-op for tests"""
         pass
     
+    def stop(self):
+        """Mock stop - nothing to release"""
+        pass
+    
     def clear(self):
-        """Clear captured orders"""
-        self.orders.clear()
+        """Clear captured orders. Lists returned by get_orders() keep their contents."""
+        self.orders = []
     
     def get_orders(self) -> list[OrderRequest]:
-        """Get all captured orders"""
-        return self.orders.copy()
+        """
+        Get all captured orders, without copying.
+        
+        The list keeps growing with later orders until clear(); callers must
+        not modify it.
+        """
+        return self.orders
 
 
 # -----------------------------------------------------------------------------
@@ -225,6 +327,10 @@ class IntegrationTestHarness:
         harness.inject_orderbook(token_id, bids, asks)
         harness.inject_trade(token_id, price, size, side)
         
+        with harness.batch_trades():
+            harness.inject_trade(token_id, price, size, side)
+            harness.inject_trade(token_id, price, size, side)
+        
         orders = harness.get_captured_orders()
     """
     
@@ -244,6 +350,12 @@ class IntegrationTestHarness:
         self.registry = StrategyRegistry()
         
         self.app: Optional[App] = None
+        # Lifecycle of self.app, so initialize_and_run only starts it once
+        self._initialized = False
+        self._running = False
+        
+        # Trades held back by batch_trades(), keyed by token
+        self._pending_trades: Optional[dict[str, list[tuple[float, float, str]]]] = None
     
     def build_app(self) -> App:
         """
@@ -259,20 +371,26 @@ class IntegrationTestHarness:
             .with_limit_store(self.mock_limit_store) \
             .with_registry(self.registry) \
             .build()
+        self._initialized = False
+        self._running = False
         
         return self.app
     
     def initialize_and_run(self):
-        """Initialize and run the app"""
-        if self.app is None:
-            self.build_app()
-        self.app.initialize()
-        self.app.run()
+        """Initialize and run the app. Steps the app has already been through are skipped."""
+        app = self.app if self.app is not None else self.build_app()
+        if not self._initialized:
+            app.initialize()
+            self._initialized = True
+        if not self._running:
+            app.run()
+            self._running = True
     
     def stop(self):
         """Stop the app"""
         if self.app:
             self.app.stop()
+        self._running = False
     
     def inject_orderbook(
         self,
@@ -283,6 +401,23 @@ class IntegrationTestHarness:
         """Inject an orderbook snapshot"""
         self.mock_ws.inject_orderbook_snapshot(token_id, bids, asks)
     
+    def inject_price_change(
+        self,
+        token_id: str,
+        price: float,
+        size: float,
+        side: str,
+    ):
+        """Inject a price change setting one level to an absolute size"""
+        self.mock_ws.inject_price_change(token_id, price, size, side)
+    
+    def get_orderbook(self, token_id: str) -> OrderBook:
+        """The channel's live orderbook for token_id"""
+        assert self.app is not None, "build_app() must be called first"
+        channel = self.app.channel
+        assert isinstance(channel, Channel)
+        return channel.orderbook_manager.get_orderbook(token_id)
+    
     def inject_trade(
         self,
         token_id: str,
@@ -290,11 +425,30 @@ class IntegrationTestHarness:
         size: float,
         side: str,
     ):
-        """Inject a trade event"""
-        self.mock_ws.inject_trade(token_id, price, size, side)
+        """Inject a trade event, or queue it inside batch_trades()"""
+        if self._pending_trades is not None:
+            self._pending_trades.setdefault(token_id, []).append((price, size, side))
+        else:
+            self.mock_ws.inject_trade(token_id, price, size, side)
+    
+    @contextmanager
+    def batch_trades(self) -> Iterator[None]:
+        """
+        Collect the trades injected inside the block and send them when it
+        exits, one websocket call per token, in injection order per token.
+        """
+        pending: dict[str, list[tuple[float, float, str]]] = {}
+        self._pending_trades = pending
+        try:
+            yield
+            self._pending_trades = None
+            for token_id, trades in pending.items():
+                self.mock_ws.inject_trades(token_id, trades)
+        finally:
+            self._pending_trades = None
     
     def get_captured_orders(self) -> list[OrderRequest]:
-        """Get all captured orders from the mock EML"""
+        """Get all captured orders from the mock EML. The list is read-only and not a copy."""
         return self.mock_eml.get_orders()
     
     def clear_orders(self):
@@ -307,20 +461,35 @@ class IntegrationTestHarness:
         instrument_ids: list[str],
         limits: list[InstrumentLimit],
         name: str = "",
-    ):
+    ) -> RegistrationEntry:
         """
         Register a strategy with this harness's isolated registry.
         
         This is a convenience method that calls the SDK's register_strategy
         but targets this harness's registry.
         """
-        register_strategy(
+        return register_strategy(
             strat_class=strat_class,
             instrument_ids=instrument_ids,
             limits=limits,
             name=name,
             registry=self.registry,
         )
+    
+    @contextmanager
+    def registered_strategy(
+        self,
+        strat_class: type[Strategy],
+        instrument_ids: list[str],
+        limits: list[InstrumentLimit],
+        name: str = "",
+    ) -> Iterator[RegistrationEntry]:
+        """Register a strategy for the duration of a with block"""
+        entry = self.register_strategy(strat_class, instrument_ids, limits, name)
+        try:
+            yield entry
+        finally:
+            self.registry.unregister(entry.name)
 
 
 # -----------------------------------------------------------------------------
@@ -330,14 +499,46 @@ class IntegrationTestHarness:
 @pytest.fixture
 def harness():
     """Create a test harness for each test"""
-    # Reset the global strategy registry before each test
-    StrategyRegistry.reset()
-    
+    # Tests register with the harness's own registry, so the global registry
+    # never needs wiping here
     h = IntegrationTestHarness()
     yield h
     h.stop()
 
 
+# Decimals are parsed once here rather than in every test
+_THOUSAND = Decimal(1000)
+_HUNDRED_K = Decimal(100000)
+
+# Position limits generous enough that no test order is ever rejected
+DEFAULT_LIMITS = {
+    "max_position_bid": _THOUSAND,
+    "max_position_ask": _THOUSAND,
+    "max_nominal_position_bid": _HUNDRED_K,
+    "max_nominal_position_ask": _HUNDRED_K,
+}
+
+
+@cache
+def default_limit(token_id: str) -> InstrumentLimit:
+    """The DEFAULT_LIMITS for token_id, built once per token"""
+    return InstrumentLimit(instrument_id=token_id, **DEFAULT_LIMITS)
+
+
+@pytest.fixture
+def registered_strategy(harness: IntegrationTestHarness):
+    """Register a strategy for a single instrument with the default limits, for a with block"""
+    def _registered(strat_class: type[Strategy], token_id: str, name: str = ""):
+        return harness.registered_strategy(
+            strat_class=strat_class,
+            instrument_ids=[token_id],
+            limits=[default_limit(token_id)],
+            name=name,
+        )
+    
+    return _registered
+
+
 # -----------------------------------------------------------------------------
 # Test Strategies
 # -----------------------------------------------------------------------------
@@ -352,139 +553,105 @@ class TradeFollowingStrategy(Strategy):
     
     def on_trade(self, instrument_id: str, trade: TradeData, orderbook: OrderBook) -> list[SDKOrder]:
         # Place a buy order at the trade price for 10 units
-        return [
-            SDKOrder(
-                instrument_id=instrument_id,
-                side=Side.BUY,
-                price=trade.price,
-                volume=Decimal("10"),
-            )
-        ]
+        return [SDKOrder(instrument_id, Side.BUY, trade.price, 10.0)]
     
     def on_order_book_change(self, instrument_id: str, orderbook: OrderBook) -> list[SDKOrder]:
         return []
 
 
+def make_orderbook_tracking_strategy(orderbook_states: list[dict]) -> type[Strategy]:
+    """
+    A strategy class that records the best bid and ask it sees on every trade
+    into orderbook_states. The app creates the instance, so the states are
+    handed in here; each test passes its own list.
+    """
+    class OrderbookTrackingStrategy(Strategy):
+        def on_trade(self, instrument_id: str, trade: TradeData, orderbook: OrderBook) -> list[SDKOrder]:
+            # Capture the orderbook state when trade is received
+            orderbook_states.append({
+                "best_bid": orderbook.best_bid().price if orderbook.best_bid() else None,
+                "best_ask": orderbook.best_ask().price if orderbook.best_ask() else None,
+            })
+            return []
+        
+        def on_order_book_change(self, instrument_id: str, orderbook: OrderBook) -> list[SDKOrder]:
+            return []
+    
+    return OrderbookTrackingStrategy
+
+
 # -----------------------------------------------------------------------------
 # Integration Tests
 # -----------------------------------------------------------------------------
 
-def test_trade_following_strategy_sends_order_at_trade_price(harness: IntegrationTestHarness):
+TRADE_FOLLOWER_TOKEN = "trade_follower_token"
+
+
+@pytest.fixture
+def trade_follower(harness: IntegrationTestHarness, registered_strategy):
+    """A running harness with TradeFollowingStrategy on TRADE_FOLLOWER_TOKEN, a book and no captured orders"""
+    with registered_strategy(TradeFollowingStrategy, TRADE_FOLLOWER_TOKEN, "TradeFollower"):
+        harness.build_app()
+        harness.initialize_and_run()
+        
+        harness.inject_orderbook(
+            token_id=TRADE_FOLLOWER_TOKEN,
+            bids=[(0.50, 100.0), (0.49, 200.0), (0.48, 300.0)],
+            asks=[(0.51, 100.0), (0.52, 200.0), (0.53, 300.0)],
+        )
+        
+        # Clear any orders from the snapshot phase
+        harness.clear_orders()
+        yield harness
+
+
+@pytest.mark.parametrize(
+    "trade_prices, expected_count",
+    [([0.505], 1), ([0.51, 0.52, 0.53], 3), ([0.40], 1)],
+    ids=["single", "multi", "below_book"],
+)
+def test_trade_following_strategy_sends_order_at_trade_price(
+    trade_follower: IntegrationTestHarness,
+    trade_prices: list[float],
+    expected_count: int,
+):
     """
     Test the complete flow:
     1. Subscribe to an instrument
     2. Receive an orderbook snapshot
-    3. Receive a trade
-    4. Strategy generates an order at the trade price
+    3. Receive trades
+    4. Strategy generates an order at each trade price
     
     This verifies the entire data path from exchange message to strategy order.
     """
-    # Define test instrument
-    test_token_id = "test_token_123"
-    
-    # Register the strategy using the harness's isolated registry
-    harness.register_strategy(
-        strat_class=TradeFollowingStrategy,
-        instrument_ids=[test_token_id],
-        limits=[
-            InstrumentLimit(
-                instrument_id=test_token_id,
-                max_position_bid=Decimal("1000"),
-                max_position_ask=Decimal("1000"),
-                max_nominal_position_bid=Decimal("100000"),
-                max_nominal_position_ask=Decimal("100000"),
+    # Inject the trades in one batch
+    with trade_follower.batch_trades():
+        for price in trade_prices:
+            trade_follower.inject_trade(
+                token_id=TRADE_FOLLOWER_TOKEN,
+                price=price,
+                size=10.0,
+                side="BUY",
             )
-        ],
-        name="TradeFollower",
-    )
-    
-    # Build and initialize the app
-    harness.build_app()
-    harness.initialize_and_run()
-    
-    # Inject an orderbook snapshot
-    harness.inject_orderbook(
-        token_id=test_token_id,
-        bids=[(0.50, 100.0), (0.49, 200.0), (0.48, 300.0)],
-        asks=[(0.51, 100.0), (0.52, 200.0), (0.53, 300.0)],
-    )
-    
-    # Clear any orders from the snapshot phase
-    harness.clear_orders()
-    
-    # Inject a trade at price 0.505
-    trade_price = 0.505
-    trade_size = 50.0
-    harness.inject_trade(
-        token_id=test_token_id,
-        price=trade_price,
-        size=trade_size,
-        side="BUY",
-    )
     
     # Get captured orders
-    orders = harness.get_captured_orders()
+    orders = trade_follower.get_captured_orders()
     
-    # Assert we got exactly one order
-    assert len(orders) == 1, f"Expected 1 order, got {len(orders)}"
-    
-    order = orders[0]
+    # Assert we got exactly one order per trade
+    assert len(orders) == expected_count, f"Expected {expected_count} orders, got {len(orders)}"
     
     # Assert order properties
-    assert order.instrument_id == test_token_id
-    assert order.side == CoreSide.BUY
-    assert float(order.price) == pytest.approx(trade_price, rel=1e-6)
-    assert float(order.quantity) == 10.0
-
-
-def test_multiple_trades_generate_multiple_orders(harness: IntegrationTestHarness):
-    """Test that multiple trades generate multiple orders"""
-    test_token_id = "multi_trade_token"
-    
-    harness.register_strategy(
-        strat_class=TradeFollowingStrategy,
-        instrument_ids=[test_token_id],
-        limits=[
-            InstrumentLimit(
-                instrument_id=test_token_id,
-                max_position_bid=Decimal("1000"),
-                max_position_ask=Decimal("1000"),
-                max_nominal_position_bid=Decimal("100000"),
-                max_nominal_position_ask=Decimal("100000"),
-            )
-        ],
-        name="MultiTradeFollower",
-    )
-    
-    harness.build_app()
-    harness.initialize_and_run()
-    
-    # Inject orderbook
-    harness.inject_orderbook(
-        token_id=test_token_id,
-        bids=[(0.50, 100.0)],
-        asks=[(0.51, 100.0)],
-    )
-    harness.clear_orders()
-    
-    # Inject multiple trades
-    trade_prices = [0.51, 0.52, 0.53]
-    for price in trade_prices:
-        harness.inject_trade(
-            token_id=test_token_id,
-            price=price,
-            size=10.0,
-            side="BUY",
-        )
-    
-    orders = harness.get_captured_orders()
-    
-    assert len(orders) == 3
-    for i, order in enumerate(orders):
-        assert float(order.price) == pytest.approx(trade_prices[i], rel=1e-6)
+    for order, trade_price in zip(orders, trade_prices):
+        assert order.instrument_id == TRADE_FOLLOWER_TOKEN
+        assert order.side == CoreSide.BUY
+        assert float(order.price) == pytest.approx(trade_price, rel=1e-6)
+        assert float(order.quantity) == 10.0
 
 
-def test_orderbook_is_populated_before_strategy_receives_trade(harness: IntegrationTestHarness):
+def test_orderbook_is_populated_before_strategy_receives_trade(
+    harness: IntegrationTestHarness,
+    registered_strategy,
+):
     """
     Test that when a strategy receives a trade, it can also access
     the current orderbook state.
@@ -492,54 +659,54 @@ def test_orderbook_is_populated_before_strategy_receives_trade(harness: Integrat
     test_token_id = "orderbook_test_token"
     
     # Track what orderbook state the strategy sees
-    orderbook_states = []
+    orderbook_states: list[dict] = []
+    strategy_class = make_orderbook_tracking_strategy(orderbook_states)
     
-    class OrderbookTrackingStrategy(Strategy):
-        def on_trade(self, instrument_id: str, trade: TradeData, orderbook: OrderBook) -> list[SDKOrder]:
-            # Capture the orderbook state when trade is received
-            orderbook_states.append({
-                "best_bid": orderbook.best_bid().price if orderbook.best_bid() else None,
-                "best_ask": orderbook.best_ask().price if orderbook.best_ask() else None,
-            })
-            return []
+    with registered_strategy(strategy_class, test_token_id, "OrderbookTracker"):
+        harness.build_app()
+        harness.initialize_and_run()
         
-        def on_order_book_change(self, instrument_id: str, orderbook: OrderBook) -> list[SDKOrder]:
-            return []
+        # Inject orderbook with known bid/ask
+        harness.inject_orderbook(
+            token_id=test_token_id,
+            bids=[(0.45, 100.0)],
+            asks=[(0.55, 100.0)],
+        )
+        
+        # Inject a trade
+        harness.inject_trade(
+            token_id=test_token_id,
+            price=0.50,
+            size=10.0,
+            side="BUY",
+        )
+        
+        # Verify the strategy saw the correct orderbook state
+        assert len(orderbook_states) == 1
+        assert orderbook_states[0]["best_bid"] == pytest.approx(0.45, rel=1e-6)
+        assert orderbook_states[0]["best_ask"] == pytest.approx(0.55, rel=1e-6)
+
+
+def test_emptied_level_is_removed_despite_float_deltas(harness: IntegrationTestHarness, registered_strategy):
+    """
+    Sizes 0.1 -> 0.2 -> 0.3 -> 0 arrive as float deltas that do not sum to
+    exactly 0. The emptied level must still leave the book rather than stay
+    behind with a tiny volume as the best bid.
+    """
+    test_token_id = "emptied_level_token"
     
-    harness.register_strategy(
-        strat_class=OrderbookTrackingStrategy,
-        instrument_ids=[test_token_id],
-        limits=[
-            InstrumentLimit(
-                instrument_id=test_token_id,
-                max_position_bid=Decimal("1000"),
-                max_position_ask=Decimal("1000"),
-                max_nominal_position_bid=Decimal("100000"),
-                max_nominal_position_ask=Decimal("100000"),
-            )
-        ],
-        name="OrderbookTracker",
-    )
-    
-    harness.build_app()
-    harness.initialize_and_run()
-    
-    # Inject orderbook with known bid/ask
-    harness.inject_orderbook(
-        token_id=test_token_id,
-        bids=[(0.45, 100.0)],
-        asks=[(0.55, 100.0)],
-    )
-    
-    # Inject a trade
-    harness.inject_trade(
-        token_id=test_token_id,
-        price=0.50,
-        size=10.0,
-        side="BUY",
-    )
-    
-    # Verify the strategy saw the correct orderbook state
-    assert len(orderbook_states) == 1
-    assert orderbook_states[0]["best_bid"] == pytest.approx(0.45, rel=1e-6)
-    assert orderbook_states[0]["best_ask"] == pytest.approx(0.55, rel=1e-6)
+    with registered_strategy(TradeFollowingStrategy, test_token_id, "EmptiedLevelFollower"):
+        harness.build_app()
+        harness.initialize_and_run()
+        
+        harness.inject_orderbook(
+            token_id=test_token_id,
+            bids=[(0.48, 0.1), (0.47, 100.0)],
+            asks=[(0.52, 100.0)],
+        )
+        for size in (0.2, 0.3, 0.0):
+            harness.inject_price_change(test_token_id, price=0.48, size=size, side="BUY")
+        
+        orderbook = harness.get_orderbook(test_token_id)
+        assert [level.price for level in orderbook.bids] == [0.47]
+        assert orderbook.midpoint() == pytest.approx(0.495, rel=1e-9)
@@ -0,0 +1,69 @@
+"""
+Unit tests for DeltaCache.
+"""
+from polybot.common.enums import Side
+from polybot.iml.delta_cache import DeltaCache
+
+
+def test_add_instrument_creates_empty_sides_once():
+    cache = DeltaCache()
+    
+    sides = cache.add_instrument("token")
+    sides[Side.BUY][4800] = 100
+    
+    assert cache.add_instrument("token") is sides
+    assert cache.get_sides("token") is sides
+    assert sides[Side.SELL] == {}
+
+
+def test_get_sides_creates_unknown_instrument():
+    cache = DeltaCache()
+    
+    assert cache.get_sides("unknown") == {Side.BUY: {}, Side.SELL: {}}
+    assert cache.get_last_size("unknown", Side.BUY, 4800) == 0
+
+
+def test_get_delta_tracks_sizes_and_returns_the_change():
+    cache = DeltaCache()
+    
+    assert cache.get_delta("token", Side.BUY, 4800, 100_000) == 100_000
+    assert cache.get_delta("token", Side.BUY, 4800, 300_000) == 200_000
+    assert cache.get_delta("token", Side.BUY, 4800, 50_000) == -250_000
+    assert cache.get_last_size("token", Side.BUY, 4800) == 50_000
+    
+    # Sides are tracked separately
+    assert cache.get_last_size("token", Side.SELL, 4800) == 0
+
+
+def test_emptied_level_is_removed():
+    cache = DeltaCache()
+    cache.update_size("token", Side.SELL, 5200, 100_000)
+    
+    assert cache.get_delta("token", Side.SELL, 5200, 0) == -100_000
+    assert cache.get_sides("token")[Side.SELL] == {}
+    
+    cache.update_size("token", Side.SELL, 5300, 100_000)
+    cache.update_size("token", Side.SELL, 5300, 0)
+    assert cache.get_sides("token")[Side.SELL] == {}
+
+
+def test_integer_ticks_cancel_exactly():
+    cache = DeltaCache()
+    
+    # 0.1 -> 0.2 -> 0.3 -> 0 in size ticks of 1e-6
+    deltas = [cache.get_delta("token", Side.BUY, 4800, size) for size in (100_000, 200_000, 300_000, 0)]
+    
+    assert sum(deltas) == 0
+    assert cache.get_last_size("token", Side.BUY, 4800) == 0
+
+
+def test_reset_levels_replaces_one_side():
+    cache = DeltaCache()
+    cache.update_size("token", Side.BUY, 4700, 100_000)
+    cache.update_size("token", Side.SELL, 5200, 100_000)
+    
+    cache.reset_levels("token", Side.BUY, {4800: 200_000})
+    
+    assert cache.get_sides("token")[Side.BUY] == {4800: 200_000}
+    assert cache.get_last_size("token", Side.BUY, 4700) == 0
+    assert cache.get_last_size("token", Side.SELL, 5200) == 100_000
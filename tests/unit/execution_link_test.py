@@ -0,0 +1,148 @@
+"""
+Unit tests for ExecutionLink order bookkeeping.
+"""
+from concurrent.futures import Future
+from typing import Optional
+
+import pytest
+
+from polybot.common.enums import OrderStatus, OrderType, Side
+from polybot.common.types import FAILED_ORDER_ID, OrderRequest
+from polybot.eml import ExecutionLink
+from polybot.limits.limit import LimitCheckResult
+from polybot.state import OrderManager
+
+
+class RecordingGem:
+    """Exchange link that records what it was asked to do"""
+    
+    def __init__(self, post: Optional[Future] = None):
+        self.sent: list[OrderRequest] = []
+        self.cancelled: list[str] = []
+        self.stopped = False
+        # Handed back for every send, standing in for an asynchronous post
+        self._post = post
+    
+    def send_order(self, order: OrderRequest) -> Optional[Future]:
+        self.sent.append(order)
+        return self._post
+    
+    def cancel_order(self, exchange_order_id: str):
+        self.cancelled.append(exchange_order_id)
+    
+    def stop(self):
+        self.stopped = True
+
+
+class FixedLimitStore:
+    """Limit store that allows or rejects every order, recording released capacity"""
+    
+    def __init__(self, allowed: bool = True):
+        self._result = LimitCheckResult(allowed=allowed)
+        self.released: list[tuple] = []
+    
+    def try_reserve_capacity(self, instrument_id, side, volume, price) -> LimitCheckResult:
+        return self._result
+    
+    def set_limit(self, instrument_id, limit):
+        pass
+    
+    def set_limits(self, items):
+        pass
+    
+    def release_reserved_capacity(self, instrument_id, side, volume, price):
+        self.released.append((instrument_id, side, volume, price))
+    
+    def apply_fill(self, instrument_id, side, reserved_price, reserved_volume, fill_price, fill_volume):
+        pass
+
+
+def _order(instrument_id: str = "token") -> OrderRequest:
+    return OrderRequest(
+        instrument_id=instrument_id,
+        side=Side.BUY,
+        order_type=OrderType.LIMIT,
+        price=0.5,
+        quantity=10.0,
+    )
+
+
+def test_sent_order_is_readable_as_soon_as_send_returns():
+    gem = RecordingGem()
+    order_manager = OrderManager()
+    link = ExecutionLink(gem, FixedLimitStore(), order_manager)
+    
+    order_id = link.send_order(_order())
+    
+    assert gem.sent == [_order()]
+    assert [order.order_id for order in order_manager.get_active_orders("token")] == [order_id]
+
+
+def test_rejected_order_is_not_sent_or_recorded():
+    gem = RecordingGem()
+    order_manager = OrderManager()
+    link = ExecutionLink(gem, FixedLimitStore(allowed=False), order_manager)
+    
+    assert link.send_order(_order()) == FAILED_ORDER_ID
+    assert gem.sent == []
+    assert order_manager.get_all_active_orders() == ()
+
+
+def test_cancel_of_unknown_order_id_raises():
+    gem = RecordingGem()
+    link = ExecutionLink(gem, FixedLimitStore(), OrderManager())
+    
+    with pytest.raises(KeyError):
+        link.cancel_order(12345)
+    assert gem.cancelled == []
+
+
+def test_stop_stops_the_exchange_link():
+    gem = RecordingGem()
+    link = ExecutionLink(gem, FixedLimitStore(), OrderManager())
+    
+    link.stop()
+    
+    assert gem.stopped
+
+
+def test_failed_post_rejects_the_order_and_releases_its_capacity():
+    post = Future()
+    limit_store = FixedLimitStore()
+    order_manager = OrderManager()
+    link = ExecutionLink(RecordingGem(post), limit_store, order_manager)
+    
+    order_id = link.send_order(_order())
+    assert order_manager.orders[order_id].status == OrderStatus.INFLIGHT
+    
+    post.set_exception(RuntimeError("rejected"))
+    
+    assert order_manager.orders[order_id].status == OrderStatus.REJECTED
+    assert order_manager.get_all_active_orders() == ()
+    assert limit_store.released == [("token", Side.BUY, 10.0, 0.5)]
+
+
+def test_post_that_failed_before_recording_is_still_rejected():
+    post = Future()
+    post.set_exception(RuntimeError("rejected"))
+    limit_store = FixedLimitStore()
+    order_manager = OrderManager()
+    link = ExecutionLink(RecordingGem(post), limit_store, order_manager)
+    
+    order_id = link.send_order(_order())
+    
+    assert order_manager.orders[order_id].status == OrderStatus.REJECTED
+    assert len(limit_store.released) == 1
+
+
+def test_successful_post_keeps_the_order_and_its_capacity():
+    post = Future()
+    limit_store = FixedLimitStore()
+    order_manager = OrderManager()
+    link = ExecutionLink(RecordingGem(post), limit_store, order_manager)
+    
+    order_id = link.send_order(_order())
+    post.set_result({"success": True})
+    
+    assert order_manager.orders[order_id].status == OrderStatus.INFLIGHT
+    assert limit_store.released == []
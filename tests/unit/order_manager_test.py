@@ -0,0 +1,119 @@
+"""
+Unit tests for OrderManager order tracking and its active order indexes.
+"""
+from polybot.common.enums import OrderStatus, OrderType, Side
+from polybot.common.types import OrderRequest
+from polybot.state import OrderManager
+
+
+def _request(instrument_id: str, quantity: float = 10.0) -> OrderRequest:
+    return OrderRequest(
+        instrument_id=instrument_id,
+        side=Side.BUY,
+        order_type=OrderType.LIMIT,
+        price=0.5,
+        quantity=quantity,
+    )
+
+
+def _ids(orders) -> list:
+    return [order.order_id for order in orders]
+
+
+def test_added_orders_are_active_in_placement_order():
+    manager = OrderManager()
+    
+    first = manager.add_order(_request("a"))
+    second = manager.add_order(_request("b"))
+    third = manager.add_order(_request("a"))
+    
+    assert _ids(manager.get_active_orders("a")) == [first, third]
+    assert _ids(manager.get_active_orders("b")) == [second]
+    assert _ids(manager.get_all_active_orders()) == [first, second, third]
+    assert manager.get_active_orders("unknown") == ()
+    assert manager.orders[first].status == OrderStatus.INFLIGHT
+
+
+def test_finished_orders_leave_the_active_indexes():
+    manager = OrderManager()
+    filled = manager.add_order(_request("a", quantity=10.0))
+    cancelled = manager.add_order(_request("a"))
+    resting = manager.add_order(_request("a"))
+    
+    manager.add_fill_quantity(filled, 4.0)
+    assert filled in _ids(manager.get_active_orders("a"))
+    manager.add_fill_quantity(filled, 6.0)
+    
+    manager.cancel_requested(cancelled)
+    assert manager.orders[cancelled].status == OrderStatus.INFLIGHT_CANCELLED
+    assert cancelled in _ids(manager.get_active_orders("a"))
+    manager.order_cancelled(cancelled)
+    
+    assert manager.orders[filled].status == OrderStatus.FILLED
+    assert manager.orders[cancelled].status == OrderStatus.CANCELLED
+    assert _ids(manager.get_active_orders("a")) == [resting]
+    assert _ids(manager.get_all_active_orders()) == [resting]
+    # Finished orders are still recorded
+    assert set(manager.orders) == {filled, cancelled, resting}
+
+
+def test_exchange_order_id_activates_the_order():
+    manager = OrderManager()
+    order_id = manager.add_order(_request("a"))
+    
+    manager.add_exchange_order_id(order_id, "0xabc")
+    
+    assert manager.orders[order_id].status == OrderStatus.ACTIVE
+    assert manager.get_exchange_order_id_from_order_id(order_id) == "0xabc"
+    assert manager.get_order_id_from_exchange_order_id("0xabc") == order_id
+    assert _ids(manager.get_active_orders("a")) == [order_id]
+
+
+def test_timestamps_are_ints():
+    manager = OrderManager()
+    order_id = manager.add_order(_request("a"))
+    order = manager.orders[order_id]
+    assert type(order.created_at) is int and type(order.updated_at) is int
+    
+    manager.add_exchange_order_id(order_id, "0xabc")
+    assert type(order.updated_at) is int
+    manager.add_fill_quantity(order_id, 1.0)
+    assert type(order.updated_at) is int
+    manager.cancel_requested(order_id)
+    assert type(order.updated_at) is int
+    manager.order_cancelled(order_id)
+    assert type(order.updated_at) is int
+
+
+def test_active_order_reads_are_cached_until_a_change():
+    manager = OrderManager()
+    first = manager.add_order(_request("a"))
+    
+    active = manager.get_active_orders("a")
+    all_active = manager.get_all_active_orders()
+    assert isinstance(active, tuple)
+    assert manager.get_active_orders("a") is active
+    assert manager.get_all_active_orders() is all_active
+    
+    # Adding an order to another instrument still produces fresh reads
+    manager.add_order(_request("b"))
+    assert _ids(manager.get_active_orders("a")) == [first]
+    assert len(manager.get_all_active_orders()) == 2
+
+
+def test_cached_reads_are_never_stale():
+    manager = OrderManager()
+    first = manager.add_order(_request("a"))
+    assert _ids(manager.get_active_orders("a")) == [first]
+    
+    second = manager.add_order(_request("a"))
+    assert _ids(manager.get_active_orders("a")) == [first, second]
+    
+    manager.cancel_requested(first)
+    manager.order_cancelled(first)
+    assert _ids(manager.get_active_orders("a")) == [second]
+    assert _ids(manager.get_all_active_orders()) == [second]
+    
+    manager.add_fill_quantity(second, 10.0)
+    assert manager.get_active_orders("a") == ()
+    assert manager.get_all_active_orders() == ()
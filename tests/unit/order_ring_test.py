@@ -0,0 +1,188 @@
+"""
+Unit tests for the OrderRing and the OrderSender draining it.
+"""
+import threading
+
+import pytest
+
+from polybot.channel import OrderRing, OrderSender
+from polybot.common.enums import OrderType, Side
+from polybot.common.exceptions import OrderRingFullError, OrderSendError
+from polybot.common.types import OrderRequest
+
+
+def _order(price: float) -> OrderRequest:
+    return OrderRequest(
+        instrument_id="token",
+        side=Side.BUY,
+        order_type=OrderType.LIMIT,
+        price=price,
+        quantity=10.0,
+    )
+
+
+def _prices(orders) -> list[float]:
+    return [order.price for order in orders]
+
+
+class RecordingExecLink:
+    """Exec link that records sent orders and fails for prices in failing"""
+    
+    def __init__(self, failing: frozenset = frozenset()):
+        self.sent: list[OrderRequest] = []
+        self._failing = failing
+    
+    def send_order(self, order: OrderRequest):
+        if order.price in self._failing:
+            raise RuntimeError(f"send of {order.price} failed")
+        self.sent.append(order)
+        return len(self.sent)
+    
+    def cancel_order(self, order_id):
+        pass
+    
+    def stop(self):
+        pass
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        OrderRing(capacity=0)
+
+
+def test_full_ring_raises():
+    ring = OrderRing(capacity=2)
+    ring.publish(_order(0.1))
+    ring.publish(_order(0.2))
+    
+    with pytest.raises(OrderRingFullError):
+        ring.publish(_order(0.3))
+    assert len(ring) == 2
+    
+    # Draining frees the slots again
+    ring.drain(1)
+    ring.publish(_order(0.3))
+    assert _prices(ring.drain()) == [0.2, 0.3]
+
+
+def test_drain_is_oldest_first_and_bounded():
+    ring = OrderRing(capacity=8)
+    for price in (0.1, 0.2, 0.3, 0.4, 0.5):
+        ring.publish(_order(price))
+    
+    assert _prices(ring.drain(2)) == [0.1, 0.2]
+    assert _prices(ring.drain(10)) == [0.3, 0.4, 0.5]
+    assert ring.drain() == []
+    assert len(ring) == 0
+
+
+def test_indexes_wrap_around():
+    ring = OrderRing(capacity=3)
+    published = []
+    drained = []
+    
+    # Uneven publish and drain runs move the slots across the end of the ring
+    price = 0.0
+    for publish_count, drain_count in [(2, 1), (2, 2), (2, 2), (1, 2), (3, 3)]:
+        for _ in range(publish_count):
+            price = round(price + 0.01, 2)
+            ring.publish(_order(price))
+            published.append(price)
+        drained.extend(_prices(ring.drain(drain_count)))
+    
+    assert drained == published
+    assert len(ring) == 0
+    # Drained slots are released rather than kept alive by the ring
+    assert ring._slots == [None, None, None]
+
+
+def test_wait_times_out_until_published_or_woken():
+    ring = OrderRing(capacity=2)
+    assert not ring.wait(timeout=0.01)
+    
+    ring.publish(_order(0.1))
+    assert ring.wait(timeout=0.01)
+    
+    ring.clear_ready()
+    assert not ring.wait(timeout=0.01)
+    
+    ring.wake()
+    assert ring.wait(timeout=0.01)
+    assert len(ring) == 1
+
+
+def test_wake_releases_a_blocked_waiter():
+    ring = OrderRing(capacity=2)
+    woken = []
+    waiter = threading.Thread(target=lambda: woken.append(ring.wait(timeout=5)))
+    waiter.start()
+    
+    ring.wake()
+    waiter.join(timeout=5)
+    
+    assert woken == [True]
+
+
+def test_sender_sends_in_order_and_flushes_on_stop():
+    ring = OrderRing(capacity=64)
+    eml = RecordingExecLink()
+    sender = OrderSender(ring, eml, batch_size=4, idle_timeout=0.01)
+    
+    sender.start()
+    assert sender.is_running
+    prices = [round(0.01 * i, 2) for i in range(1, 41)]
+    for price in prices:
+        ring.publish(_order(price))
+    sender.stop()
+    
+    assert not sender.is_running
+    assert _prices(eml.sent) == prices
+    assert len(ring) == 0
+
+
+def test_stop_flushes_orders_published_before_start():
+    ring = OrderRing(capacity=8)
+    eml = RecordingExecLink()
+    sender = OrderSender(ring, eml)
+    ring.publish(_order(0.1))
+    
+    sender.start()
+    sender.stop()
+    
+    assert _prices(eml.sent) == [0.1]
+
+
+def test_failed_send_is_raised_by_the_next_publish():
+    ring = OrderRing(capacity=8)
+    eml = RecordingExecLink(failing=frozenset({0.2}))
+    sender = OrderSender(ring, eml)
+    for price in (0.1, 0.2, 0.3):
+        ring.publish(_order(price))
+    
+    # Other orders are still sent
+    sender._send_batch(ring.drain())
+    assert _prices(eml.sent) == [0.1, 0.3]
+    
+    with pytest.raises(OrderSendError) as raised:
+        ring.publish(_order(0.4))
+    assert isinstance(raised.value.__cause__, RuntimeError)
+    assert len(ring) == 0
+    
+    # The failure is raised once
+    ring.publish(_order(0.4))
+    assert len(ring) == 1
+
+
+def test_failed_send_is_raised_by_stop():
+    ring = OrderRing(capacity=8)
+    eml = RecordingExecLink(failing=frozenset({0.1}))
+    sender = OrderSender(ring, eml)
+    ring.publish(_order(0.1))
+    ring.publish(_order(0.2))
+    
+    sender.start()
+    with pytest.raises(OrderSendError):
+        sender.stop()
+    
+    assert not sender.is_running
+    assert _prices(eml.sent) == [0.2]
@@ -0,0 +1,213 @@
+"""
+Unit tests for OrderBook level maintenance, the cached midpoint and the
+batched delta merge.
+"""
+import random
+
+import pytest
+
+from polybot.common.enums import Side
+from polybot.common.orderbook import Level, OrderBook
+from polybot.iml.messages import REMOVE_LEVEL, LevelDelta
+
+
+def _book() -> OrderBook:
+    book = OrderBook()
+    book.populate(
+        bids=[(0.47, 10.0), (0.49, 30.0), (0.48, 20.0)],
+        asks=[(0.53, 20.0), (0.51, 10.0), (0.52, 30.0)],
+    )
+    return book
+
+
+def _assert_consistent(book: OrderBook):
+    """Sides are sorted and their search keys match the levels"""
+    bid_prices = [level.price for level in book.bids]
+    ask_prices = [level.price for level in book.asks]
+    assert bid_prices == sorted(bid_prices, reverse=True)
+    assert ask_prices == sorted(ask_prices)
+    assert book._bid_keys == [-price for price in bid_prices]
+    assert book._ask_keys == ask_prices
+
+
+def test_populate_sorts_both_sides():
+    book = _book()
+    
+    assert book.bids == [Level(0.49, 30.0), Level(0.48, 20.0), Level(0.47, 10.0)]
+    assert book.asks == [Level(0.51, 10.0), Level(0.52, 30.0), Level(0.53, 20.0)]
+    assert book.midpoint() == pytest.approx(0.50)
+    _assert_consistent(book)
+
+
+@pytest.mark.parametrize(
+    "price, side, expected_prices",
+    [
+        (0.50, Side.BUY, [0.50, 0.49, 0.48, 0.47]),
+        (0.475, Side.BUY, [0.49, 0.48, 0.475, 0.47]),
+        (0.46, Side.BUY, [0.49, 0.48, 0.47, 0.46]),
+        (0.505, Side.SELL, [0.505, 0.51, 0.52, 0.53]),
+        (0.54, Side.SELL, [0.51, 0.52, 0.53, 0.54]),
+    ],
+    ids=["bid_top", "bid_middle", "bid_bottom", "ask_top", "ask_bottom"],
+)
+def test_update_level_inserts_in_sorted_position(price, side, expected_prices):
+    book = _book()
+    
+    book.update_level(price, 5.0, side)
+    
+    levels = book.bids if side == Side.BUY else book.asks
+    assert [level.price for level in levels] == expected_prices
+    _assert_consistent(book)
+
+
+def test_update_level_sets_volume_of_existing_level():
+    book = _book()
+    
+    book.update_level(0.48, 25.0, Side.BUY)
+    
+    assert book.bids[1] == Level(0.48, 25.0)
+    assert len(book.bids) == 3
+
+
+def test_update_level_with_zero_volume_removes_top_of_book():
+    book = _book()
+    assert book.midpoint() == pytest.approx(0.50)
+    
+    book.update_level(0.49, 0, Side.BUY)
+    book.update_level(0.51, 0, Side.SELL)
+    
+    assert book.best_bid() == Level(0.48, 20.0)
+    assert book.best_ask() == Level(0.52, 30.0)
+    assert book.midpoint() == pytest.approx(0.50)
+    _assert_consistent(book)
+
+
+def test_update_level_with_zero_volume_at_unseen_price_is_ignored():
+    book = _book()
+    
+    book.update_level(0.45, 0, Side.BUY)
+    
+    assert [level.price for level in book.bids] == [0.49, 0.48, 0.47]
+
+
+def test_midpoint_follows_top_of_book_changes():
+    book = _book()
+    assert book.midpoint() == pytest.approx(0.50)
+    
+    # A new best bid
+    book.update_level(0.50, 1.0, Side.BUY)
+    assert book.midpoint() == pytest.approx(0.505)
+    
+    # Removing the best ask through a delta
+    book.apply_deltas([LevelDelta(0.51, -10.0, Side.SELL)])
+    assert book.midpoint() == pytest.approx(0.51)
+    
+    # Volume changes below the top leave the cached midpoint valid
+    book.adjust_volume(0.48, 5.0, Side.BUY)
+    assert book.midpoint() == pytest.approx(0.51)
+    
+    # An emptied side has no midpoint
+    book.apply_deltas([LevelDelta(price, REMOVE_LEVEL, Side.BUY) for price in (0.50, 0.49, 0.48, 0.47)])
+    assert book.bids == []
+    assert book.midpoint() is None
+    
+    book.clear()
+    assert book.midpoint() is None
+
+
+def test_midpoint_is_recomputed_after_populate():
+    book = _book()
+    assert book.midpoint() == pytest.approx(0.50)
+    
+    book.populate(bids=[(0.30, 1.0)], asks=[(0.40, 1.0)])
+    
+    assert book.midpoint() == pytest.approx(0.35)
+
+
+def test_adjust_volume():
+    book = _book()
+    
+    assert book.adjust_volume(0.48, 5.0, Side.BUY)
+    assert book.bids[1] == Level(0.48, 25.0)
+    
+    assert book.adjust_volume(0.48, -25.0, Side.BUY)
+    assert [level.price for level in book.bids] == [0.49, 0.47]
+    
+    # Unlike apply_deltas, an unseen price is not inserted
+    assert not book.adjust_volume(0.45, 5.0, Side.BUY)
+    assert [level.price for level in book.bids] == [0.49, 0.47]
+    _assert_consistent(book)
+
+
+def test_apply_deltas_inserts_updates_and_removes():
+    book = _book()
+    
+    book.apply_deltas([
+        LevelDelta(0.46, 4.0, Side.BUY),         # Insert below the book
+        LevelDelta(0.49, -10.0, Side.BUY),       # Update the best bid
+        LevelDelta(0.52, REMOVE_LEVEL, Side.SELL),
+        LevelDelta(0.60, -1.0, Side.SELL),       # Cancel at an unseen price
+    ])
+    
+    assert book.bids == [Level(0.49, 20.0), Level(0.48, 20.0), Level(0.47, 10.0), Level(0.46, 4.0)]
+    assert book.asks == [Level(0.51, 10.0), Level(0.53, 20.0)]
+    _assert_consistent(book)
+
+
+def test_path_cache_survives_levels_shifting():
+    book = _book()
+    
+    # Remember the last bid, then shift every level under the remembered index
+    book.update_level(0.47, 11.0, Side.BUY)
+    book.update_level(0.49, 0, Side.BUY)
+    book.update_level(0.495, 1.0, Side.BUY)
+    book.update_level(0.50, 1.0, Side.BUY)
+    
+    book.update_level(0.47, 12.0, Side.BUY)
+    book.update_level(0.48, 21.0, Side.BUY)
+    
+    assert book.bids == [Level(0.50, 1.0), Level(0.495, 1.0), Level(0.48, 21.0), Level(0.47, 12.0)]
+    _assert_consistent(book)
+
+
+def test_depth_counts_levels_up_to_price():
+    book = _book()
+    
+    assert book.depth(0.48, Side.BUY) == pytest.approx(50.0)
+    assert book.depth(0.52, Side.SELL) == pytest.approx(40.0)
+    assert book.depth(0.60, Side.SELL) == pytest.approx(60.0)
+
+
+def _random_deltas(rng: random.Random, n: int) -> list[LevelDelta]:
+    deltas = []
+    for _ in range(n):
+        side = rng.choice((Side.BUY, Side.SELL))
+        if side == Side.BUY:
+            price = rng.choice((0.44, 0.45, 0.46, 0.47, 0.48, 0.49))
+        else:
+            price = rng.choice((0.51, 0.52, 0.53, 0.54, 0.55, 0.56))
+        size_delta = rng.choice((REMOVE_LEVEL, -15.0, -5.0, -0.5, 0.5, 5.0, 15.0))
+        deltas.append(LevelDelta(price, size_delta, side))
+    return deltas
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_merged_batch_matches_incremental_application(seed):
+    rng = random.Random(seed)
+    deltas = _random_deltas(rng, rng.randint(32, 200))
+    
+    merged = _book()
+    incremental = _book()
+    merged.midpoint()
+    incremental.midpoint()
+    
+    # The batch is far larger than the book, so it is merged in one pass
+    merged.apply_deltas(deltas)
+    for delta in deltas:
+        incremental.apply_deltas([delta])
+    
+    assert merged.bids == incremental.bids
+    assert merged.asks == incremental.asks
+    assert merged.midpoint() == incremental.midpoint()
+    _assert_consistent(merged)
+    _assert_consistent(incremental)
@@ -0,0 +1,94 @@
+"""
+Unit tests for PolymarketGem order posting.
+"""
+import threading
+
+import pytest
+
+from polybot.common.enums import OrderType, Side
+from polybot.common.types import OrderRequest
+from polybot.polymarket.polymarket_gem import PolymarketGem
+
+
+class FakeClobClient:
+    """
+    Stands in for ClobClient. Orders are "signed" into their token id and
+    posts are recorded; a post blocks while release is clear, and raises
+    for tokens in failing.
+    """
+    
+    def __init__(self, failing: frozenset = frozenset()):
+        self.posted: list[str] = []
+        self.release = threading.Event()
+        self.release.set()
+        self._failing = failing
+    
+    def create_order(self, order_args):
+        return order_args.token_id
+    
+    def post_order(self, signed_order, order_type):
+        self.release.wait()
+        if signed_order in self._failing:
+            raise RuntimeError(f"post of {signed_order} failed")
+        self.posted.append(signed_order)
+        return {"success": True}
+
+
+def _order(instrument_id: str) -> OrderRequest:
+    return OrderRequest(
+        instrument_id=instrument_id,
+        side=Side.BUY,
+        order_type=OrderType.LIMIT,
+        price=0.5,
+        quantity=10.0,
+    )
+
+
+def test_successful_post_resolves_its_future():
+    client = FakeClobClient()
+    gem = PolymarketGem(clob_client=client)
+    
+    post = gem.send_order(_order("a"))
+    
+    assert post.result(timeout=5) == {"success": True}
+    assert client.posted == ["a"]
+    gem.stop()
+
+
+def test_failed_post_fails_its_future():
+    client = FakeClobClient(failing=frozenset({"bad"}))
+    gem = PolymarketGem(clob_client=client)
+    
+    post = gem.send_order(_order("bad"))
+    
+    with pytest.raises(RuntimeError, match="post of bad failed"):
+        post.result(timeout=5)
+    assert client.posted == []
+    gem.stop()
+
+
+def test_stop_drains_pending_posts_in_order():
+    client = FakeClobClient()
+    client.release.clear()
+    gem = PolymarketGem(clob_client=client)
+    
+    posts = [gem.send_order(_order(token)) for token in ("a", "b", "c")]
+    stopper = threading.Thread(target=gem.stop)
+    stopper.start()
+    
+    # stop() waits for the queued posts rather than dropping them
+    stopper.join(timeout=0.1)
+    assert stopper.is_alive()
+    assert client.posted == []
+    
+    client.release.set()
+    stopper.join(timeout=5)
+    
+    assert not stopper.is_alive()
+    assert all(post.done() for post in posts)
+    assert client.posted == ["a", "b", "c"]
+
+
+def test_credentials_or_client_required():
+    with pytest.raises(ValueError):
+        PolymarketGem()
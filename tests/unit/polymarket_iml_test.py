@@ -0,0 +1,33 @@
+"""
+Unit tests for PolymarketIml message handling.
+"""
+import pytest
+
+from polybot.polymarket import PolymarketIml
+from polybot.polymarket.polymarket_iml import order_book_summary_event_to_market_event
+from polybot.polymarket.types.messages import OrderBookSummaryEvent
+
+
+class NullWebsocket:
+    """Websocket that accepts subscriptions and never delivers messages"""
+    
+    def subscribe_to_market(self, token_id: str):
+        pass
+
+
+def test_book_summary_without_asset_is_ignored():
+    iml = PolymarketIml(ws=NullWebsocket())
+    emitted = []
+    iml.emit_message = emitted.append
+    
+    iml.handle_order_book_summary_event(
+        OrderBookSummaryEvent(event_type="book", bids=[{"price": 0.5, "size": 1.0}])
+    )
+    
+    assert emitted == []
+    assert None not in iml.delta_cache._cache
+
+
+def test_converting_a_book_summary_without_asset_raises():
+    with pytest.raises(ValueError, match="asset_id"):
+        order_book_summary_event_to_market_event(OrderBookSummaryEvent(event_type="book"))
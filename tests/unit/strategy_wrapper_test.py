@@ -0,0 +1,35 @@
+"""
+Unit tests for the conversion of SDK orders to core orders.
+"""
+import pytest
+
+from polybot.common.enums import OrderType, Side as CoreSide
+from sdk.enums import Side as SDKSide
+from sdk.internal.strategy_wrapper import _convert_sdk_orders
+from sdk.types import Order as SDKOrder
+
+
+def test_orders_are_converted_to_core_orders():
+    (core_order,) = _convert_sdk_orders([SDKOrder("token", SDKSide.SELL, 0.25, 10)])
+    
+    assert core_order.instrument_id == "token"
+    assert core_order.side == CoreSide.SELL
+    assert core_order.order_type == OrderType.LIMIT
+    assert core_order.price == 0.25
+    assert type(core_order.quantity) is float and core_order.quantity == 10.0
+
+
+def test_no_orders_converts_to_an_empty_list():
+    assert _convert_sdk_orders([]) == []
+
+
+@pytest.mark.parametrize("side", ["buy", CoreSide.BUY, None], ids=["str", "core_side", "none"])
+def test_invalid_side_raises_value_error(side):
+    with pytest.raises(ValueError, match="Invalid order side"):
+        _convert_sdk_orders([SDKOrder("token", side, 0.5, 10.0)])
+
+
+@pytest.mark.parametrize("price, volume", [(0.0, 10.0), (0.5, -1.0)], ids=["price", "volume"])
+def test_non_positive_price_or_volume_raises_value_error(price, volume):
+    with pytest.raises(ValueError, match="greater than 0"):
+        _convert_sdk_orders([SDKOrder("token", SDKSide.BUY, price, volume)])